@@ -6,10 +6,57 @@ It filters accounts containing specific substrings ('5040', '5030', '4020') and
 aggregated amounts by job number and account type.
 """
 
+import re
+import numpy as np
 import pandas as pd
 import logging
 from typing import Dict, List, Optional
 from .column_mapping import map_dataframe_columns, validate_required_columns
+from .excel_reader import READ_EXCEL_ENGINE
+from .merge_data import normalize_job_numbers
+
+# numba compiles the job/account-type scatter-add used by aggregate_gl_data.
+# It is optional: without it the aggregation uses pandas' pivot_table.
+try:
+    from numba import njit, prange, get_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# GL exports with at least this many rows are summed by the multi-threaded
+# kernel; below it, starting the threads costs more than it saves
+PARALLEL_AGGREGATION_MIN_ROWS = 200_000
+
+
+def standardize_gl_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Map GL Inquiry columns to standard names and check the required ones.
+    
+    Args:
+        df (pd.DataFrame): GL data as exported
+        
+    Returns:
+        pd.DataFrame: GL data with standard column names
+        
+    Raises:
+        ValueError: If required columns are missing
+    """
+    # Use the standardized column mapping approach
+    df = map_dataframe_columns(df, 'gl_inquiry')
+    
+    # Validate required columns
+    required_columns = ['Account', 'Job Number', 'Debit', 'Credit']
+    column_mapping = {col: col for col in df.columns}  # Identity mapping after standardization
+    is_valid, missing_columns = validate_required_columns('gl_inquiry', column_mapping, required_columns)
+    
+    if not is_valid:
+        raise ValueError(f"Required columns missing: {missing_columns}. Available columns: {list(df.columns)}")
+    
+    # Trim job numbers once here; aggregation and the WIP merge reuse them
+    df['Job Number'] = normalize_job_numbers(df['Job Number'])
+    
+    return df
 
 
 def load_gl_inquiry(file_path: str) -> pd.DataFrame:
@@ -27,19 +74,10 @@ def load_gl_inquiry(file_path: str) -> pd.DataFrame:
         ValueError: If required columns are missing
     """
     try:
-        # Load the Excel file
-        df = pd.read_excel(file_path)
-        
-        # Use the standardized column mapping approach
-        df = map_dataframe_columns(df, 'gl_inquiry')
+        # Load the Excel file (with calamine when it's installed)
+        df = pd.read_excel(file_path, engine=READ_EXCEL_ENGINE)
         
-        # Validate required columns
-        required_columns = ['Account', 'Job Number', 'Debit', 'Credit']
-        column_mapping = {col: col for col in df.columns}  # Identity mapping after standardization
-        is_valid, missing_columns = validate_required_columns('gl_inquiry', column_mapping, required_columns)
-        
-        if not is_valid:
-            raise ValueError(f"Required columns missing: {missing_columns}. Available columns: {list(df.columns)}")
+        df = standardize_gl_columns(df)
         
         logging.info(f"Successfully loaded GL Inquiry file with {len(df)} records")
         return df
@@ -49,6 +87,27 @@ def load_gl_inquiry(file_path: str) -> pd.DataFrame:
         raise
 
 
+def match_account_filters(accounts: pd.Series, account_filters: List[str]) -> np.ndarray:
+    """
+    Build a boolean mask of accounts containing any of the filter substrings.
+    
+    GL exports repeat a small set of account codes across many rows, so the
+    substring match runs once per distinct account and is broadcast back to
+    every row through the factorized codes.
+    
+    Args:
+        accounts (pd.Series): Account column (any dtype)
+        account_filters (List[str]): Account substrings to match
+        
+    Returns:
+        np.ndarray: Boolean mask aligned with accounts
+    """
+    codes, uniques = pd.factorize(accounts.astype(str), use_na_sentinel=False)
+    pattern = '|'.join(re.escape(account_filter) for account_filter in account_filters)
+    unique_mask = pd.Series(uniques).str.contains(pattern, na=False).to_numpy(dtype=bool)
+    return unique_mask[codes]
+
+
 def filter_gl_accounts(df: pd.DataFrame, account_filters: List[str] = None) -> pd.DataFrame:
     """
     Filter GL data for accounts containing specific substrings.
@@ -68,7 +127,7 @@ def filter_gl_accounts(df: pd.DataFrame, account_filters: List[str] = None) -> p
     df['Account'] = df['Account'].astype(str)
     
     # Create a boolean mask for accounts containing any of the filter strings
-    mask = df['Account'].str.contains('|'.join(account_filters), na=False)
+    mask = match_account_filters(df['Account'], account_filters)
     
     filtered_df = df[mask].copy()
     
@@ -86,16 +145,19 @@ def compute_amounts(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: GL data with computed Amount and Amount Billed columns
     """
-    # Fill NaN values with 0 for numeric calculations
-    df['Debit'] = pd.to_numeric(df['Debit'], errors='coerce').fillna(0)
-    df['Credit'] = pd.to_numeric(df['Credit'], errors='coerce').fillna(0)
+    # Fill NaN values with 0 for numeric calculations, as plain float arrays
+    # so the arithmetic below doesn't build intermediate Series
+    debit = pd.to_numeric(df['Debit'], errors='coerce').to_numpy(dtype=np.float64, na_value=0.0)
+    credit = pd.to_numeric(df['Credit'], errors='coerce').to_numpy(dtype=np.float64, na_value=0.0)
+    df['Debit'] = debit
+    df['Credit'] = credit
     
     # Compute Amount = Debit + Credit (for 5040 and 5030 accounts)
-    df['Amount'] = df['Debit'] + df['Credit']
+    df['Amount'] = debit + credit
     
     # Compute Amount Billed = positive Credit only (for 4020 accounts)
     # Credit values are negative in GL, but we want positive amounts in the report
-    df['Amount Billed'] = -df['Credit']  # Flip the sign to make negative Credit values positive
+    df['Amount Billed'] = -credit  # Flip the sign to make negative Credit values positive
     
     logging.info("Computed Amount field as Debit + Credit")
     logging.info("Computed Amount Billed field as positive Credit only (column L)")
@@ -106,22 +168,108 @@ def determine_account_type(account: str) -> str:
     """
     Determine the account type based on the account number.
     
+    Runs classify_account_types on a single account, so both always agree:
+    5040 = Sub Labor, 5030 = Material, 4020 = Other.
+    
     Args:
         account (str): Account number or code
         
     Returns:
-        str: Account type ('Material', 'Sub Labor', 'Other')
+        str: Account type ('Material', 'Sub Labor', 'Other', 'Unknown')
     """
-    account_str = str(account)
+    return classify_account_types(pd.Series([account], dtype=object))[0]
+
+
+# Account types in the (alphabetical) order their columns appear in the
+# aggregated data
+ACCOUNT_TYPES = ['Material', 'Other', 'Sub Labor', 'Unknown']
+
+
+def classify_account_types(accounts: pd.Series) -> pd.Categorical:
+    """
+    Determine the account type of every account at once.
+    
+    The first matching code wins, in the order 5040, 5030, 4020 (Sub Labor,
+    Material, Other). As in match_account_filters, the codes are matched once
+    per distinct account and broadcast back to every row through the
+    factorized codes. The result is categorical, so grouping
+    on it works on small integer codes instead of strings.
     
-    if '5040' in account_str:
-        return 'Sub Labor'  # 5040 = Sub Labor costs
-    elif '5030' in account_str:
-        return 'Material'   # 5030 = Material costs
-    elif '4020' in account_str:
-        return 'Other'
+    Args:
+        accounts (pd.Series): Account numbers or codes (any dtype)
+        
+    Returns:
+        pd.Categorical: Account types, with ACCOUNT_TYPES as categories
+    """
+    codes, uniques = pd.factorize(accounts.astype(str), use_na_sentinel=False)
+    uniques = pd.Series(uniques, dtype=object)
+    conditions = [
+        uniques.str.contains('5040', regex=False, na=False).to_numpy(dtype=bool),
+        uniques.str.contains('5030', regex=False, na=False).to_numpy(dtype=bool),
+        uniques.str.contains('4020', regex=False, na=False).to_numpy(dtype=bool),
+    ]
+    choices = [ACCOUNT_TYPES.index(account_type) for account_type in ['Sub Labor', 'Material', 'Other']]
+    unique_type_codes = np.select(conditions, choices, default=ACCOUNT_TYPES.index('Unknown')).astype(np.int8)
+    return pd.Categorical.from_codes(unique_type_codes[codes], categories=ACCOUNT_TYPES)
+
+
+def _scatter_add(job_ids: np.ndarray, type_ids: np.ndarray, amounts: np.ndarray, out: np.ndarray) -> None:
+    for i in range(job_ids.size):
+        out[job_ids[i], type_ids[i]] += amounts[i]
+
+
+def _scatter_add_chunked(job_ids: np.ndarray, type_ids: np.ndarray, amounts: np.ndarray, out: np.ndarray,
+                         n_chunks: int) -> None:
+    # Each chunk of rows sums into its own buffer, so the threads never write
+    # to the same cell; the buffers are added together at the end
+    partial = np.zeros((n_chunks, out.shape[0], out.shape[1]))
+    chunk_size = (job_ids.size + n_chunks - 1) // n_chunks
+    for chunk in prange(n_chunks):
+        start = chunk * chunk_size
+        stop = min(start + chunk_size, job_ids.size)
+        for i in range(start, stop):
+            partial[chunk, job_ids[i], type_ids[i]] += amounts[i]
+    for chunk in range(n_chunks):
+        out += partial[chunk]
+
+
+if NUMBA_AVAILABLE:
+    _scatter_add = njit(cache=True)(_scatter_add)
+    _scatter_add_chunked = njit(parallel=True, cache=True, nogil=True)(_scatter_add_chunked)
+
+
+def sum_amounts_by_type(job_numbers: pd.Series, account_types: pd.Series, amounts: pd.Series,
+                        parallel: bool = False) -> pd.DataFrame:
+    """
+    Sum amounts per job and account type with a single scatter-add pass.
+    
+    Produces the same table as pivot_table(index='Job Number', columns='Account
+    Type', values='Amount', aggfunc='sum', fill_value=0) on float amounts: jobs
+    and account types sorted, rows without a job number dropped and missing
+    amounts counted as 0.
+    
+    Args:
+        job_numbers (pd.Series): Job Number of each record
+        account_types (pd.Series): Account Type of each record
+        amounts (pd.Series): Amount of each record
+        parallel (bool): Split the rows into one chunk per numba thread
+        
+    Returns:
+        pd.DataFrame: Summed amounts indexed by Job Number, one column per Account Type
+    """
+    has_job = job_numbers.notna().to_numpy()
+    job_ids, jobs = pd.factorize(job_numbers[has_job], sort=True)
+    type_ids, types = pd.factorize(account_types[has_job], sort=True)
+    values = np.nan_to_num(amounts[has_job].to_numpy(dtype=np.float64, na_value=0.0))
+    
+    out = np.zeros((len(jobs), len(types)))
+    if parallel:
+        n_chunks = get_num_threads() if NUMBA_AVAILABLE else 1
+        _scatter_add_chunked(job_ids, type_ids, values, out, n_chunks)
     else:
-        return 'Unknown'
+        _scatter_add(job_ids, type_ids, values, out)
+    
+    return pd.DataFrame(out, index=pd.Index(jobs, name='Job Number'), columns=pd.Index(types))
 
 
 def aggregate_gl_data(df: pd.DataFrame) -> pd.DataFrame:
@@ -138,25 +286,24 @@ def aggregate_gl_data(df: pd.DataFrame) -> pd.DataFrame:
     if 'Amount' not in df.columns or 'Amount Billed' not in df.columns:
         df = compute_amounts(df)
     
-    # Trim whitespace from Job Number
-    df['Job Number'] = df['Job Number'].astype(str).str.strip()
+    # Trim whitespace from Job Number (a no-op for columns trimmed at load)
+    df['Job Number'] = normalize_job_numbers(df['Job Number'])
     
     # Determine account type for each record
-    df['Account Type'] = df['Account'].apply(determine_account_type)
-    
-    # Group by Job Number and Account Type, sum the Amount and Amount Billed
-    aggregated_df = df.groupby(['Job Number', 'Account Type']).agg({
-        'Amount': 'sum',
-        'Amount Billed': 'sum'
-    }).reset_index()
+    df['Account Type'] = classify_account_types(df['Account'])
     
-    # Pivot to have Account Types as columns for Amount
-    pivot_df = aggregated_df.pivot(index='Job Number', columns='Account Type', values='Amount').fillna(0)
-    pivot_df = pivot_df.reset_index()
+    # Sum Amount per Job Number with Account Types as columns (large exports
+    # are split across threads)
+    if NUMBA_AVAILABLE:
+        pivot_df = sum_amounts_by_type(df['Job Number'], df['Account Type'], df['Amount'],
+                                       parallel=len(df) >= PARALLEL_AGGREGATION_MIN_ROWS)
+    else:
+        pivot_df = df.pivot_table(index='Job Number', columns='Account Type', values='Amount',
+                                  aggfunc='sum', fill_value=0)
     
-    # Pivot for Amount Billed and merge
-    billed_pivot_df = aggregated_df.groupby('Job Number')['Amount Billed'].sum().reset_index()
-    pivot_df = pd.merge(pivot_df, billed_pivot_df, on='Job Number', how='left')
+    # Amount Billed is summed per job across all account types
+    pivot_df['Amount Billed'] = df.groupby('Job Number')['Amount Billed'].sum()
+    pivot_df = pivot_df.rename_axis(columns=None).reset_index()
     
     # Ensure we have the expected columns
     expected_columns = ['Material', 'Sub Labor', 'Other']
@@ -7,8 +7,18 @@ and WIP worksheets.
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-from difflib import SequenceMatcher
+
+import numpy as np
+
+# rapidfuzz scores string pairs in C. It is optional: without it the same
+# similarity score is computed in pure Python by _indel_ratio.
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 
 # Standard column mappings for different file types
@@ -46,10 +56,33 @@ COLUMN_MAPPINGS = {
     }
 }
 
+# Reverse index for exact matches: {file_type: {lowered variation: (standard
+# name, position in its variation list)}}. The position lets the variation
+# listed first win when a file has several of them.
+_EXACT_INDEX = {
+    file_type: {
+        variation.lower(): (standard_name, rank)
+        for standard_name, variations in reversed(list(mappings.items()))
+        for rank, variation in reversed(list(enumerate(variations)))
+    }
+    for file_type, mappings in COLUMN_MAPPINGS.items()
+}
+
+# Word sets of the standard names, for the token overlap score in
+# suggest_column_mappings: {file_type: {standard name: lowered words}}
+_TOKENS = {
+    file_type: {standard_name: frozenset(standard_name.lower().split()) for standard_name in mappings}
+    for file_type, mappings in COLUMN_MAPPINGS.items()
+}
+
 
 def get_similarity_score(str1: str, str2: str) -> float:
     """
-    Calculate similarity score between two strings using SequenceMatcher.
+    Calculate a case-insensitive similarity score between two strings.
+    
+    The score is the Indel ratio, 2 * longest common subsequence / total
+    length, computed by rapidfuzz when it is installed and by _indel_ratio
+    otherwise, so column mappings don't depend on whether rapidfuzz is there.
     
     Args:
         str1 (str): First string
@@ -58,7 +91,41 @@ def get_similarity_score(str1: str, str2: str) -> float:
     Returns:
         float: Similarity score between 0 and 1
     """
-    return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
+    return _lowered_similarity(str1.lower(), str2.lower())
+
+
+def _lowered_similarity(lowered1: str, lowered2: str) -> float:
+    # get_similarity_score for strings that are already lower-cased, so loops
+    # can lower each name once instead of on every comparison
+    if RAPIDFUZZ_AVAILABLE:
+        return fuzz.ratio(lowered1, lowered2) / 100.0
+    return _indel_ratio(lowered1, lowered2)
+
+
+def _indel_ratio(str1: str, str2: str) -> float:
+    # Pure Python equivalent of rapidfuzz's fuzz.ratio / 100. difflib's
+    # SequenceMatcher.ratio counts matching blocks found greedily, which can
+    # be lower than the longest common subsequence, so it isn't used here.
+    total = len(str1) + len(str2)
+    if not total:
+        return 1.0
+    # Longest common subsequence, keeping one row of the DP table
+    previous = [0] * (len(str2) + 1)
+    for char1 in str1:
+        current = [0]
+        for j, char2 in enumerate(str2):
+            if char1 == char2:
+                current.append(previous[j] + 1)
+            else:
+                current.append(max(previous[j + 1], current[j]))
+        previous = current
+    return 2.0 * previous[-1] / total
+
+
+def _token_overlap(tokens1: frozenset, tokens2: frozenset) -> float:
+    # Jaccard similarity of two word sets: 1.0 for the same words in any order
+    union = tokens1 | tokens2
+    return len(tokens1 & tokens2) / len(union) if union else 0.0
 
 
 def find_best_column_match(target_column: str, available_columns: List[str], 
@@ -74,11 +141,21 @@ def find_best_column_match(target_column: str, available_columns: List[str],
     Returns:
         Optional[str]: Best matching column name or None if no good match found
     """
+    if RAPIDFUZZ_AVAILABLE:
+        # One C call scores every column (ties go to the first, as below)
+        result = process.extractOne(target_column, available_columns, scorer=fuzz.ratio,
+                                    processor=str.lower, score_cutoff=threshold * 100)
+        best_match = result[0] if result else None
+        best_score = result[1] / 100.0 if result else 0.0
+        logging.debug(f"Best match for '{target_column}': '{best_match}' (score: {best_score:.2f})")
+        return best_match
+    
     best_match = None
     best_score = 0.0
+    lowered_target = target_column.lower()
     
     for available_col in available_columns:
-        score = get_similarity_score(target_column, available_col)
+        score = _lowered_similarity(lowered_target, available_col.lower())
         if score > best_score and score >= threshold:
             best_score = score
             best_match = available_col
@@ -92,10 +169,13 @@ def map_columns_for_file_type(available_columns: List[str], file_type: str,
     """
     Map available columns to standard column names for a specific file type.
     
+    Mappings are cached per column list, so mapping another export with the
+    same headers skips the fuzzy matching.
+    
     Args:
         available_columns (List[str]): List of available column names in the file
         file_type (str): Type of file ('gl_inquiry', 'wip_worksheet', 'wip_report')
-        strict_mode (bool): If True, only use exact matches from COLUMN_MAPPINGS
+        strict_mode (bool): If True, only use exact (case-insensitive) matches from COLUMN_MAPPINGS
         
     Returns:
         Dict[str, str]: Mapping from available column names to standard names
@@ -106,27 +186,48 @@ def map_columns_for_file_type(available_columns: List[str], file_type: str,
     if file_type not in COLUMN_MAPPINGS:
         raise ValueError(f"Unknown file type: {file_type}. Available types: {list(COLUMN_MAPPINGS.keys())}")
     
+    # Hand out a fresh dict: callers may modify the mapping they get back
+    return dict(_map_columns_cached(tuple(available_columns), file_type, strict_mode))
+
+
+@lru_cache(maxsize=32)
+def _map_columns_cached(available_columns: Tuple[str, ...], file_type: str,
+                        strict_mode: bool) -> Tuple[Tuple[str, str], ...]:
     column_mapping = {}
     standard_mappings = COLUMN_MAPPINGS[file_type]
     
-    for standard_name, variations in standard_mappings.items():
-        found_column = None
-        
-        # First, try exact matches from the predefined variations
-        for variation in variations:
-            if variation in available_columns:
-                found_column = variation
-                break
-        
-        # If no exact match and not in strict mode, try fuzzy matching
-        if not found_column and not strict_mode:
-            found_column = find_best_column_match(standard_name, available_columns)
-        
+    # First, look every column up among the predefined variations (ignoring
+    # case), keeping the earliest listed variation for each standard name
+    exact_index = _EXACT_INDEX[file_type]
+    exact_matches = {}
+    for column in available_columns:
+        match = exact_index.get(str(column).lower())
+        if match:
+            standard_name, rank = match
+            if standard_name not in exact_matches or rank < exact_matches[standard_name][0]:
+                exact_matches[standard_name] = (rank, column)
+    
+    found_columns = {standard_name: column for standard_name, (_, column) in exact_matches.items()}
+    
+    # Then fuzzy-match only the standard names still missing, and only against
+    # the columns no exact match claimed (skipped entirely when nothing is left)
+    if not strict_mode:
+        exact_columns = set(found_columns.values())
+        remaining_columns = [column for column in available_columns if column not in exact_columns]
+        remaining_names = [name for name in standard_mappings if name not in found_columns]
+        if remaining_columns:
+            for standard_name in remaining_names:
+                found_column = find_best_column_match(standard_name, remaining_columns)
+                if found_column:
+                    found_columns[standard_name] = found_column
+    
+    for standard_name in standard_mappings:
+        found_column = found_columns.get(standard_name)
         if found_column:
             column_mapping[found_column] = standard_name
             logging.info(f"Mapped '{found_column}' -> '{standard_name}'")
     
-    return column_mapping
+    return tuple(column_mapping.items())
 
 
 def validate_required_columns(file_type: str, column_mapping: Dict[str, str], 
@@ -183,11 +284,35 @@ def suggest_column_mappings(file_type: str, available_columns: List[str]) -> Dic
     suggestions = {}
     standard_mappings = COLUMN_MAPPINGS[file_type]
     
+    # Score each pair by the better of character similarity and word overlap,
+    # so reordered names like 'Budget Material' and 'Material Budget' rank high
+    standard_tokens = _TOKENS[file_type]
+    column_tokens = [frozenset(col.lower().split()) for col in available_columns]
+    
+    if RAPIDFUZZ_AVAILABLE and available_columns:
+        # Score every standard/available pair in one multi-threaded call
+        standard_names = list(standard_mappings.keys())
+        scores = process.cdist(standard_names, available_columns, scorer=fuzz.ratio,
+                               processor=str.lower, workers=-1)
+        overlap = np.array([[_token_overlap(standard_tokens[name], tokens) * 100 for tokens in column_tokens]
+                            for name in standard_names])
+        scores = np.maximum(scores, overlap)
+        for standard_name, row_scores in zip(standard_names, scores):
+            # Top 3 with similarity > 0.3, ties kept in column order
+            top = np.argsort(-row_scores, kind='stable')[:3]
+            suggestions[standard_name] = [available_columns[i] for i in top if row_scores[i] > 30]
+        return suggestions
+    
+    # Lower every column name once, not once per standard name
+    lowered_columns = [col.lower() for col in available_columns]
+    
     for standard_name in standard_mappings.keys():
         # Find all columns with similarity > 0.3
         candidates = []
-        for available_col in available_columns:
-            score = get_similarity_score(standard_name, available_col)
+        lowered_name = standard_name.lower()
+        tokens = standard_tokens[standard_name]
+        for available_col, lowered_col, col_tokens in zip(available_columns, lowered_columns, column_tokens):
+            score = max(_lowered_similarity(lowered_name, lowered_col), _token_overlap(tokens, col_tokens))
             if score > 0.3:
                 candidates.append((available_col, score))
         
@@ -207,7 +332,8 @@ def apply_column_mapping(df, column_mapping: Dict[str, str]):
         column_mapping (Dict[str, str]): Mapping from current to new column names
         
     Returns:
-        pandas DataFrame: DataFrame with renamed columns
+        pandas DataFrame: DataFrame with renamed columns (always a new frame,
+        so callers can assign columns without changing df)
     """
     # Only rename columns that exist in the DataFrame
     valid_mapping = {old_name: new_name for old_name, new_name in column_mapping.items() 
@@ -218,6 +344,8 @@ def apply_column_mapping(df, column_mapping: Dict[str, str]):
         logging.info(f"Applied column mapping: {valid_mapping}")
         return df_renamed
     else:
+        # Still return a new frame: callers such as standardize_gl_columns
+        # assign columns in place (the copy is lazy under copy-on-write)
         logging.warning("No valid column mappings found to apply")
         return df.copy()
 
@@ -233,7 +361,8 @@ def get_unmapped_columns(available_columns: List[str], column_mapping: Dict[str,
     Returns:
         List[str]: List of unmapped column names
     """
-    mapped_columns = set(column_mapping.keys())
+    # A dict's keys view already has O(1) lookups; anything else becomes a set
+    mapped_columns = column_mapping.keys() if isinstance(column_mapping, dict) else set(column_mapping)
     unmapped = [col for col in available_columns if col not in mapped_columns]
     
     if unmapped:
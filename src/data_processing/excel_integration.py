@@ -8,6 +8,8 @@ updating only the data values in specific sections.
 
 import logging
 import os
+import re
+import weakref
 import shutil
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
@@ -16,16 +18,30 @@ from pathlib import Path
 import pandas as pd
 from openpyxl import load_workbook, Workbook
 from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 from openpyxl.cell.cell import Cell
 
+# polars is optional; get_existing_data_from_section can return a polars
+# DataFrame when it is installed
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
 
-def load_wip_workbook(file_path: str, keep_vba: bool = True) -> Workbook:
+
+def load_wip_workbook(file_path: str, keep_vba: bool = True, read_only: bool = False) -> Workbook:
     """
     Load the WIP Report workbook with VBA preservation.
     
+    Read-only workbooks are streamed from the file with cached values instead of
+    formulas, which is much faster and lighter for callers that only inspect
+    cells. They can't be modified or saved and should be closed when done.
+    
     Args:
         file_path (str): Path to the WIP Report Excel file
         keep_vba (bool): Whether to preserve VBA macros (default: True)
+        read_only (bool): Whether to open a read-only, values-only workbook (default: False)
         
     Returns:
         Workbook: Loaded openpyxl workbook object
@@ -38,8 +54,11 @@ def load_wip_workbook(file_path: str, keep_vba: bool = True) -> Workbook:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"WIP Report file not found: {file_path}")
         
-        # Load workbook with VBA preservation
-        workbook = load_workbook(file_path, keep_vba=keep_vba, data_only=False)
+        if read_only:
+            workbook = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+        else:
+            # Load workbook with VBA preservation
+            workbook = load_workbook(file_path, keep_vba=keep_vba, data_only=False)
         
         logging.info(f"Successfully loaded WIP Report workbook: {file_path}")
         logging.info(f"Worksheets available: {workbook.sheetnames}")
@@ -90,10 +109,19 @@ def find_or_create_monthly_tab(workbook: Workbook, month_year: str) -> Worksheet
     return new_sheet
 
 
+# Marker positions found on read-only worksheets. Their contents can't change
+# once loaded, so repeated lookups (e.g. find_section_markers followed by
+# get_existing_data_from_section) reuse the first scan; entries are dropped
+# together with the worksheet.
+_read_only_marker_cache: "weakref.WeakKeyDictionary[ReadOnlyWorksheet, Dict[str, Optional[Tuple[int, int]]]]" = weakref.WeakKeyDictionary()
+
+
 def find_section_markers(worksheet: Worksheet, markers: List[str]) -> Dict[str, Optional[Tuple[int, int]]]:
     """
     Find the start positions of sections marked by specific strings.
     
+    Results for read-only worksheets are cached per worksheet.
+    
     Args:
         worksheet (Worksheet): The worksheet to search
         markers (List[str]): List of marker strings to find (e.g., ['5040', '5030'])
@@ -101,24 +129,58 @@ def find_section_markers(worksheet: Worksheet, markers: List[str]) -> Dict[str,
     Returns:
         Dict[str, Optional[Tuple[int, int]]]: Dictionary mapping markers to (row, col) positions
     """
-    section_positions = {}
+    if not isinstance(worksheet, ReadOnlyWorksheet):
+        return _scan_section_markers(worksheet, markers)
     
-    for marker in markers:
-        section_positions[marker] = None
+    cached_positions = _read_only_marker_cache.setdefault(worksheet, {})
+    missing = [marker for marker in markers if marker not in cached_positions]
+    if missing:
+        cached_positions.update(_scan_section_markers(worksheet, missing))
+    
+    return {marker: cached_positions[marker] for marker in markers}
+
+
+def _scan_section_markers(worksheet: Worksheet, markers: List[str]) -> Dict[str, Optional[Tuple[int, int]]]:
+    """
+    Scan the worksheet for the first cell containing each marker.
+    
+    Args:
+        worksheet (Worksheet): The worksheet to search
+        markers (List[str]): List of marker strings to find (e.g., ['5040', '5030'])
         
-        # Search through all cells for the marker
-        for row in range(1, worksheet.max_row + 1):
-            for col in range(1, worksheet.max_column + 1):
-                cell = worksheet.cell(row=row, column=col)
-                if cell.value and marker in str(cell.value).strip():
+    Returns:
+        Dict[str, Optional[Tuple[int, int]]]: Dictionary mapping markers to (row, col) positions
+    """
+    section_positions = {marker: None for marker in markers}
+    remaining = list(section_positions)
+    # A single compiled alternation rules out most cells with one search
+    # instead of a substring test per marker
+    remaining_regex = re.compile('|'.join(re.escape(marker) for marker in remaining))
+    
+    # Search through all cells for the markers in a single pass over the
+    # values (cell() is very slow on read-only worksheets)
+    rows = worksheet.iter_rows(min_row=1, min_col=1, values_only=True)
+    for row, values in enumerate(rows, start=1):
+        if not remaining:
+            break
+        for col, value in enumerate(values, start=1):
+            if not value:
+                continue
+            cell_text = str(value).strip()
+            if not remaining_regex.search(cell_text):
+                continue
+            # A cell can hold several markers, so check each one it might
+            for marker in remaining:
+                if marker in cell_text:
                     section_positions[marker] = (row, col)
-                    logging.info(f"Found section marker '{marker}' at row {row}, column {col} (cell value: '{cell.value}')")
-                    break
-            if section_positions[marker]:
+                    logging.info(f"Found section marker '{marker}' at row {row}, column {col} (cell value: '{value}')")
+            remaining = [marker for marker in remaining if not section_positions[marker]]
+            if not remaining:
                 break
-        
-        if not section_positions[marker]:
-            logging.warning(f"Section marker '{marker}' not found in worksheet")
+            remaining_regex = re.compile('|'.join(re.escape(marker) for marker in remaining))
+    
+    for marker in remaining:
+        logging.warning(f"Section marker '{marker}' not found in worksheet")
     
     return section_positions
 
@@ -140,15 +202,25 @@ def detect_data_region(worksheet: Worksheet, start_row: int, start_col: int,
     end_row = start_row
     end_col = start_col
     
+    # Check up to max_rows rows and 20 columns. On a regular worksheet
+    # iter_rows creates every cell it visits, so stay within the cells that
+    # already exist (read-only worksheets just stream what is there)
+    last_row = start_row + max_rows - 1
+    last_col = start_col + 19
+    if not isinstance(worksheet, ReadOnlyWorksheet):
+        last_row = min(last_row, worksheet.max_row)
+        last_col = min(last_col, worksheet.max_column)
+    
     # Find the end of data by looking for empty rows
     consecutive_empty_rows = 0
-    for row in range(start_row, start_row + max_rows):
+    rows = worksheet.iter_rows(min_row=start_row, max_row=last_row,
+                               min_col=start_col, max_col=last_col, values_only=True)
+    for row, values in enumerate(rows, start=start_row):
         row_has_data = False
         
         # Check if this row has any data
-        for col in range(start_col, start_col + 20):  # Check up to 20 columns
-            cell = worksheet.cell(row=row, column=col)
-            if cell.value is not None and str(cell.value).strip():
+        for col, value in enumerate(values, start=start_col):
+            if value is not None and str(value).strip():
                 row_has_data = True
                 end_col = max(end_col, col)
                 break
@@ -176,7 +248,11 @@ def is_formula_cell(cell: Cell) -> bool:
     Returns:
         bool: True if the cell contains a formula
     """
-    return cell.data_type == 'f' or (cell.value and str(cell.value).startswith('='))
+    if cell.data_type == 'f':
+        return True
+    # Only text can hold a formula openpyxl didn't type as one
+    value = cell.value
+    return isinstance(value, str) and value.startswith('=')
 
 
 def clear_data_preserve_formulas(worksheet: Worksheet, start_row: int, end_row: int, 
@@ -196,12 +272,15 @@ def clear_data_preserve_formulas(worksheet: Worksheet, start_row: int, end_row:
     """
     cells_cleared = 0
     
-    for row in range(start_row, end_row + 1):
-        for col in range(start_col, end_col + 1):
-            cell = worksheet.cell(row=row, column=col)
+    for cells in worksheet.iter_rows(min_row=start_row, max_row=end_row,
+                                     min_col=start_col, max_col=end_col):
+        for cell in cells:
+            # Empty cells need no clearing, so skip the formula check for them
+            if cell.value is None:
+                continue
             
             # Only clear if it's not a formula cell
-            if not is_formula_cell(cell) and cell.value is not None:
+            if not is_formula_cell(cell):
                 cell.value = None
                 cells_cleared += 1
     
@@ -240,19 +319,21 @@ def write_job_data_to_section(worksheet: Worksheet, job_data: pd.DataFrame,
         logging.warning("No recognized data column found in job_data")
         return 0
     
-    # Write each job's data
-    for idx, (_, row) in enumerate(job_data.iterrows()):
-        current_row = section_start_row + 1 + idx  # +1 to skip header row
-        
+    job_col = section_start_col + job_col_offset
+    data_col = section_start_col + data_col_offset
+    
+    # Write each job's data (plain tuples; iterrows builds a Series per row)
+    rows = job_data[['Job Number', data_column]].itertuples(index=False, name=None)
+    for current_row, (job_number, value) in enumerate(rows, start=section_start_row + 1):  # +1 to skip header row
         # Write job number
-        job_cell = worksheet.cell(row=current_row, column=section_start_col + job_col_offset)
+        job_cell = worksheet.cell(row=current_row, column=job_col)
         if not is_formula_cell(job_cell):
-            job_cell.value = row['Job Number']
+            job_cell.value = job_number
         
         # Write data value
-        data_cell = worksheet.cell(row=current_row, column=section_start_col + data_col_offset)
+        data_cell = worksheet.cell(row=current_row, column=data_col)
         if not is_formula_cell(data_cell):
-            data_cell.value = row[data_column]
+            data_cell.value = value
             jobs_written += 1
     
     logging.info(f"Wrote data for {jobs_written} jobs to section starting at row {section_start_row}")
@@ -285,7 +366,9 @@ def create_backup(file_path: str, backup_dir: str = "WIP_Backups") -> str:
         backup_filename = f"{original_name}_BACKUP_{timestamp}{original_ext}"
         backup_file_path = backup_path / backup_filename
         
-        # Copy the file
+        # Copy the file (copy2 goes through copyfile, which uses in-kernel
+        # sendfile on Linux). Not a hard link: saving the workbook rewrites
+        # the original in place, which would change a linked backup with it.
         shutil.copy2(file_path, backup_file_path)
         
         logging.info(f"Created backup: {backup_file_path}")
@@ -384,38 +467,48 @@ def update_wip_report(file_path: str, material_data: pd.DataFrame, labor_data: p
     return summary
 
 
-def get_existing_data_from_section(worksheet: Worksheet, section_marker: str) -> pd.DataFrame:
+def get_existing_data_from_section(worksheet: Worksheet, section_marker: str, as_polars: bool = False):
     """
     Extract existing data from a section for comparison purposes.
     
     Args:
         worksheet (Worksheet): The worksheet to read from
         section_marker (str): Section marker to find (e.g., '5040', '5030')
+        as_polars (bool): Return a polars DataFrame instead of a pandas one (default: False)
         
     Returns:
-        pd.DataFrame: Existing data from the section
+        pd.DataFrame or pl.DataFrame: Existing data from the section
+        
+    Raises:
+        ImportError: If as_polars is set and polars isn't installed
     """
+    if as_polars and not POLARS_AVAILABLE:
+        raise ImportError("polars is required for as_polars=True")
+    
     section_positions = find_section_markers(worksheet, [section_marker])
     
     if not section_positions[section_marker]:
         logging.warning(f"Section marker '{section_marker}' not found")
-        return pd.DataFrame()
+        return pl.DataFrame() if as_polars else pd.DataFrame()
     
     start_row, start_col = section_positions[section_marker]
     end_row, end_col = detect_data_region(worksheet, start_row + 1, start_col)
     
+    # Collect plain tuples and build the frame once at the end
     data = []
-    for row in range(start_row + 1, end_row + 1):
-        job_cell = worksheet.cell(row=row, column=start_col)
-        data_cell = worksheet.cell(row=row, column=start_col + 1)
-        
-        if job_cell.value:
-            data.append({
-                'Job Number': str(job_cell.value).strip(),
-                'Current Value': data_cell.value if data_cell.value is not None else 0
-            })
+    rows = worksheet.iter_rows(min_row=start_row + 1, max_row=end_row,
+                               min_col=start_col, max_col=start_col + 1, values_only=True)
+    for job_value, data_value in rows:
+        if job_value:
+            data.append((str(job_value).strip(), data_value if data_value is not None else 0))
     
-    df = pd.DataFrame(data)
+    if as_polars:
+        # Cells can mix numbers and text, so let polars pick a common type
+        job_numbers = [job for job, _ in data]
+        values = [value for _, value in data]
+        df = pl.DataFrame({'Job Number': job_numbers, 'Current Value': values}, strict=False)
+    else:
+        df = pd.DataFrame(data, columns=['Job Number', 'Current Value'])
     logging.info(f"Extracted {len(df)} existing records from section '{section_marker}'")
     return df
 
@@ -6,22 +6,30 @@ Handles complex column structures for 5040 (Sub Labor) and 5030 (Material) secti
 
 import pandas as pd
 import logging
+import re
+import weakref
 from pathlib import Path
 from datetime import datetime
 import shutil
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Any
 from openpyxl import load_workbook, Workbook
 from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 from openpyxl.cell.cell import Cell
 
 
-def load_wip_workbook(file_path: str, keep_vba: bool = True) -> Workbook:
+def load_wip_workbook(file_path: str, keep_vba: bool = True, read_only: bool = False) -> Workbook:
     """
     Load the WIP Report workbook with VBA preservation.
     
+    Read-only workbooks are streamed from the file with cached values instead of
+    formulas, which is much faster and lighter for callers that only inspect
+    cells. They can't be modified or saved and should be closed when done.
+    
     Args:
         file_path (str): Path to the WIP Report Excel file
         keep_vba (bool): Whether to preserve VBA macros (default: True)
+        read_only (bool): Whether to open a read-only, values-only workbook (default: False)
         
     Returns:
         Workbook: The loaded openpyxl workbook object
@@ -34,7 +42,10 @@ def load_wip_workbook(file_path: str, keep_vba: bool = True) -> Workbook:
         if not Path(file_path).exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        workbook = load_workbook(file_path, keep_vba=keep_vba)
+        if read_only:
+            workbook = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+        else:
+            workbook = load_workbook(file_path, keep_vba=keep_vba)
         logging.info(f"Successfully loaded WIP workbook: {file_path}")
         return workbook
         
@@ -43,19 +54,8 @@ def load_wip_workbook(file_path: str, keep_vba: bool = True) -> Workbook:
         raise
 
 
-def find_or_create_monthly_tab(workbook: Workbook, month_year: str) -> Worksheet:
-    """
-    Find existing monthly tab or create new one based on month/year.
-    Always standardizes to 3-letter month + 2-digit year format (e.g., "Apr 25").
-    
-    Args:
-        workbook (Workbook): The WIP Report workbook
-        month_year (str): Month/year string (e.g., "Jun 25", "June 25", "April 2025")
-        
-    Returns:
-        Worksheet: The monthly worksheet
-    """
-    # Standardize to 3-letter format for all operations
+def _standardize_month_name(month_year: str) -> str:
+    """Convert a month/year string to the 3-letter month + 2-digit year tab name (e.g. "Apr 25")."""
     month_map = {
         'january': 'Jan', 'february': 'Feb', 'march': 'Mar', 'april': 'Apr',
         'may': 'May', 'june': 'Jun', 'july': 'Jul', 'august': 'Aug',
@@ -77,6 +77,25 @@ def find_or_create_monthly_tab(workbook: Workbook, month_year: str) -> Worksheet
             standard_name = f"{short_month} {year_short}"
             break
     
+    return standard_name
+
+
+def find_monthly_tab(workbook: Workbook, month_year: str) -> Optional[Worksheet]:
+    """
+    Find an existing monthly tab without creating one.
+    
+    Works on read-only workbooks, which can't get new tabs. Matches the same
+    names as find_or_create_monthly_tab.
+    
+    Args:
+        workbook (Workbook): The WIP Report workbook
+        month_year (str): Month/year string (e.g., "Jun 25", "June 25", "April 2025")
+        
+    Returns:
+        Optional[Worksheet]: The monthly worksheet, or None if the tab doesn't exist
+    """
+    standard_name = _standardize_month_name(month_year)
+    
     # Look for existing tab (check both standard and possible variations)
     target_month = standard_name.split()[0]  # e.g., "Apr"
     target_year = standard_name.split()[1]   # e.g., "25"
@@ -95,20 +114,93 @@ def find_or_create_monthly_tab(workbook: Workbook, month_year: str) -> Worksheet
             logging.info(f"Found existing monthly tab (variation): {sheet_name}")
             return workbook[sheet_name]
     
+    return None
+
+
+def find_or_create_monthly_tab(workbook: Workbook, month_year: str) -> Worksheet:
+    """
+    Find existing monthly tab or create new one based on month/year.
+    Always standardizes to 3-letter month + 2-digit year format (e.g., "Apr 25").
+    
+    Args:
+        workbook (Workbook): The WIP Report workbook
+        month_year (str): Month/year string (e.g., "Jun 25", "June 25", "April 2025")
+        
+    Returns:
+        Worksheet: The monthly worksheet
+    """
+    worksheet = find_monthly_tab(workbook, month_year)
+    if worksheet is not None:
+        return worksheet
+    
     # Create new tab with standardized name
+    standard_name = _standardize_month_name(month_year)
     new_worksheet = workbook.create_sheet(title=standard_name)
     logging.info(f"Created new monthly tab: {standard_name}")
     return new_worksheet
 
 
+# Marker positions found on read-only worksheets. Their contents can't change
+# once loaded, so repeated lookups on the same workbook reuse the first scan;
+# entries are dropped together with the worksheet.
+_read_only_marker_cache: "weakref.WeakKeyDictionary[ReadOnlyWorksheet, Dict[str, Optional[Tuple[int, int]]]]" = weakref.WeakKeyDictionary()
+
+
 def find_section_markers(worksheet: Worksheet, section_patterns: List[str]) -> Dict[str, Optional[Tuple[int, int]]]:
     """
     Find section markers in the worksheet using pattern matching.
     
+    Results for read-only worksheets are cached per worksheet.
+    
+    Args:
+        worksheet (Worksheet): The worksheet to search
+        section_patterns (List[str]): Patterns to search for (e.g., ['5040', '5030'])
+        
+    Returns:
+        Dict[str, Optional[Tuple[int, int]]]: Section positions {pattern: (row, col)}
+    """
+    if not isinstance(worksheet, ReadOnlyWorksheet):
+        return _scan_section_markers(worksheet, section_patterns)
+    
+    cached_positions = _read_only_marker_cache.setdefault(worksheet, {})
+    missing = [pattern for pattern in section_patterns if pattern not in cached_positions]
+    if missing:
+        cached_positions.update(_scan_section_markers(worksheet, missing))
+    
+    return {pattern: cached_positions[pattern] for pattern in section_patterns}
+
+
+def _scan_section_markers(worksheet: Worksheet, section_patterns: List[str]) -> Dict[str, Optional[Tuple[int, int]]]:
+    """
+    Scan the top of the worksheet for the first cell matching each pattern.
+    
     Args:
         worksheet (Worksheet): The worksheet to search
         section_patterns (List[str]): Patterns to search for (e.g., ['5040', '5030'])
         
+    Returns:
+        Dict[str, Optional[Tuple[int, int]]]: Section positions {pattern: (row, col)}
+    """
+    # Read the search window (rows 1-99, columns A-I) once as plain values;
+    # this also works on read-only worksheets, where cell() is slow
+    max_row = min(worksheet.max_row or 99, 99)
+    max_col = min(worksheet.max_column or 9, 9)
+    rows = worksheet.iter_rows(min_row=1, max_row=max_row, max_col=max_col, values_only=True)
+    
+    return find_section_markers_in_rows(rows, section_patterns)
+
+
+def find_section_markers_in_rows(rows: Iterable[Sequence[Any]], section_patterns: List[str]) -> Dict[str, Optional[Tuple[int, int]]]:
+    """
+    Find section markers in worksheet values that have already been read.
+    
+    Searches the same window as find_section_markers (rows 1-99, columns A-I),
+    so callers that read a larger block of the sheet can reuse it.
+    
+    Args:
+        rows (Iterable[Sequence[Any]]): Cell values row by row, starting at row 1
+        section_patterns (List[str]): Patterns to search for (e.g., ['5040', '5030'])
+        
     Returns:
         Dict[str, Optional[Tuple[int, int]]]: Section positions {pattern: (row, col)}
     """
@@ -120,28 +212,32 @@ def find_section_markers(worksheet: Worksheet, section_patterns: List[str]) -> D
         '5030': ['5030', '% of material', 'material - 5030', '% of material - 5030']
     }
     
+    # One compiled alternation per section instead of a substring test per
+    # search pattern, plus one for all sections to drop non-matching cells
+    section_regexes = {
+        pattern: re.compile('|'.join(re.escape(search_pattern.lower())
+                                     for search_pattern in pattern_mappings.get(pattern, [pattern])))
+        for pattern in section_patterns
+    }
+    any_section_regex = re.compile('|'.join(regex.pattern for regex in section_regexes.values()))
+    
+    cell_texts = []
+    for row, values in zip(range(1, 100), rows):
+        for col, value in enumerate(values[:9], start=1):
+            if value:
+                cell_text = str(value).lower().strip()
+                if any_section_regex.search(cell_text):
+                    cell_texts.append((row, col, value, cell_text))
+    
     for pattern in section_patterns:
         section_positions[pattern] = None
-        search_patterns = pattern_mappings.get(pattern, [pattern])
-        
-        # Search through all cells for the markers
-        for row in range(1, min(worksheet.max_row + 1, 100)):  # Search first 100 rows
-            for col in range(1, min(worksheet.max_column + 1, 10)):  # Search first 10 columns
-                cell = worksheet.cell(row=row, column=col)
-                if cell.value:
-                    cell_text = str(cell.value).lower().strip()
-                    
-                    # Check if any pattern matches
-                    for search_pattern in search_patterns:
-                        if search_pattern.lower() in cell_text:
-                            section_positions[pattern] = (row, col)
-                            logging.info(f"Found section marker '{pattern}' at row {row}, column {col}: '{cell.value}'")
-                            break
-                    
-                    if section_positions[pattern]:
-                        break
-            
-            if section_positions[pattern]:
+        section_regex = section_regexes[pattern]
+        
+        # Search the cells row by row for the first marker
+        for row, col, value, cell_text in cell_texts:
+            if section_regex.search(cell_text):
+                section_positions[pattern] = (row, col)
+                logging.info(f"Found section marker '{pattern}' at row {row}, column {col}: '{value}'")
                 break
         
         if not section_positions[pattern]:
@@ -160,7 +256,11 @@ def is_formula_cell(cell: Cell) -> bool:
     Returns:
         bool: True if the cell contains a formula
     """
-    return cell.data_type == 'f' or (cell.value and str(cell.value).startswith('='))
+    if cell.data_type == 'f':
+        return True
+    # Only text can hold a formula openpyxl didn't type as one
+    value = cell.value
+    return isinstance(value, str) and value.startswith('=')
 
 
 def is_merged_cell(worksheet: Worksheet, row: int, col: int) -> bool:
@@ -503,7 +603,9 @@ def create_backup(file_path: str, backup_dir: str = "WIP_Backups") -> str:
         backup_filename = f"{original_name}_BACKUP_{timestamp}{original_ext}"
         backup_file_path = backup_path / backup_filename
         
-        # Copy the file
+        # Copy the file (copy2 goes through copyfile, which uses in-kernel
+        # sendfile on Linux). Not a hard link: saving the workbook rewrites
+        # the original in place, which would change a linked backup with it.
         shutil.copy2(file_path, backup_file_path)
         
         logging.info(f"Created backup: {backup_file_path}")
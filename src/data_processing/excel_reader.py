@@ -0,0 +1,110 @@
+"""
+Excel Reader Module
+
+This module reads tabular Excel exports (GL Inquiry, WIP Worksheet) into pandas
+DataFrames using openpyxl's streaming reader. Rows are pulled as plain value
+tuples, which skips the per-cell object construction and conversion that
+pd.read_excel performs for every cell.
+"""
+
+import io
+import logging
+from collections import defaultdict
+from typing import BinaryIO, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+from openpyxl import load_workbook
+
+# python-calamine (Rust) parses xlsx many times faster than openpyxl. It is
+# optional: pd.read_excel callers pass READ_EXCEL_ENGINE, and None keeps
+# pandas' default engine when calamine isn't installed.
+try:
+    import python_calamine  # noqa: F401
+    READ_EXCEL_ENGINE: Optional[str] = 'calamine'
+except ImportError:
+    READ_EXCEL_ENGINE = None
+
+
+def _normalize_header(header: Sequence) -> List:
+    # Name the columns the way pd.read_excel does: blank headers become
+    # 'Unnamed: <position>' and repeated ones get '.1', '.2', ... suffixes
+    # (skipping names already in the header). Named columns are numbered
+    # before the unnamed ones, as in pandas.
+    unnamed = [i for i, value in enumerate(header) if value is None or value == '']
+    named = [i for i, value in enumerate(header) if not (value is None or value == '')]
+    columns = list(header)
+    for i in unnamed:
+        columns[i] = f"Unnamed: {i}"
+
+    counts: Dict = defaultdict(int)
+    for i in named + unnamed:
+        column = original = columns[i]
+        count = counts[column]
+        while count > 0:
+            counts[original] = count + 1
+            column = f"{original}.{count}"
+            count = count + 1 if column in columns else counts[column]
+        columns[i] = column
+        counts[column] = count + 1
+    return columns
+
+
+def read_excel_values(source: Union[str, bytes, BinaryIO], sheet_name: Optional[str] = None) -> pd.DataFrame:
+    """
+    Read a worksheet into a DataFrame, using the first row as the header.
+
+    Args:
+        source (Union[str, bytes, BinaryIO]): File path, raw file bytes, or file-like object
+        sheet_name (Optional[str]): Worksheet to read (default: first worksheet)
+
+    Returns:
+        pd.DataFrame: Worksheet data with the header row as column names
+
+    Raises:
+        FileNotFoundError: If a file path is given and the file doesn't exist
+        KeyError: If sheet_name is not in the workbook
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+
+    workbook = load_workbook(source, read_only=True, data_only=True, keep_links=False)
+    try:
+        worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        rows = worksheet.iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+
+        data = list(rows)
+    finally:
+        workbook.close()
+
+    # Drop trailing blank rows left behind by formatting-only cells
+    while data and all(value is None for value in data[-1]):
+        data.pop()
+
+    df = pd.DataFrame(data, columns=_normalize_header(header))
+    logging.debug(f"Read {len(df)} rows x {len(df.columns)} columns from Excel")
+    return df
+
+
+def read_excel_values_many(sources: Sequence[Union[str, bytes]]) -> List[pd.DataFrame]:
+    """
+    Read the first worksheet of several workbooks, one after another.
+
+    The files are read in this process on purpose. openpyxl parses in pure
+    Python and holds the GIL, so threads don't overlap the work, and starting
+    a worker process pool per call costs more than the parse itself at the
+    sizes of these exports.
+
+    Args:
+        sources (Sequence[Union[str, bytes]]): File paths or raw file bytes
+
+    Returns:
+        List[pd.DataFrame]: One DataFrame per source, in the same order
+
+    Raises:
+        FileNotFoundError: If a file path is given and the file doesn't exist
+    """
+    return [read_excel_values(source) for source in sources]
@@ -7,16 +7,27 @@ and merging with aggregated GL data. It also handles filtering of closed jobs.
 
 import pandas as pd
 import logging
-from typing import Optional, Dict, List
+from typing import BinaryIO, Optional, Dict, List, Union
 from .column_mapping import map_dataframe_columns, validate_required_columns
+from .excel_reader import READ_EXCEL_ENGINE
 
+# Arrow-backed strings keep all job numbers in one contiguous buffer, which
+# makes the strip and the merge hash join cheaper. pyarrow is optional, so fall
+# back to pandas' default string storage when it isn't installed.
+try:
+    import pyarrow  # noqa: F401
+    JOB_NUMBER_DTYPE: Optional[str] = 'string[pyarrow]'
+except ImportError:
+    JOB_NUMBER_DTYPE = None
 
-def load_wip_worksheet(file_path: str) -> pd.DataFrame:
+
+def load_wip_worksheet(file_path: Union[str, BinaryIO]) -> pd.DataFrame:
     """
     Load the WIP Worksheet Excel file into a pandas DataFrame.
     
     Args:
-        file_path (str): Path to the WIP Worksheet Excel file
+        file_path (Union[str, BinaryIO]): Path to the WIP Worksheet Excel file,
+            or a binary file-like object holding it
         
     Returns:
         pd.DataFrame: Loaded WIP data
@@ -26,20 +37,11 @@ def load_wip_worksheet(file_path: str) -> pd.DataFrame:
         ValueError: If required columns are missing
     """
     try:
-        # Load the Excel file
-        df = pd.read_excel(file_path)
-        
-        # Use the standardized column mapping approach
-        # Map columns to standard names
-        df = map_dataframe_columns(df, 'wip_worksheet')
+        # Load the Excel file (with calamine when it's installed)
+        df = pd.read_excel(file_path, engine=READ_EXCEL_ENGINE)
         
-        # Validate required columns
-        required_columns = ['Job Number', 'Status']
-        column_mapping = {col: col for col in df.columns}  # Identity mapping after standardization
-        is_valid, missing_columns = validate_required_columns('wip_worksheet', column_mapping, required_columns)
-        
-        if not is_valid:
-            raise ValueError(f"Required columns missing: {missing_columns}. Available columns: {list(df.columns)}")
+        # Map columns to standard names and validate them
+        df = standardize_wip_columns(df)
         
         logging.info(f"Successfully loaded WIP Worksheet file with {len(df)} records")
         return df
@@ -49,6 +51,54 @@ def load_wip_worksheet(file_path: str) -> pd.DataFrame:
         raise
 
 
+def standardize_wip_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Map WIP Worksheet columns to standard names and check the required ones.
+    
+    Args:
+        df (pd.DataFrame): WIP data as exported
+        
+    Returns:
+        pd.DataFrame: WIP data with standard column names
+        
+    Raises:
+        ValueError: If required columns are missing
+    """
+    # Use the standardized column mapping approach
+    df = map_dataframe_columns(df, 'wip_worksheet')
+    
+    # Validate required columns
+    required_columns = ['Job Number', 'Status']
+    column_mapping = {col: col for col in df.columns}  # Identity mapping after standardization
+    is_valid, missing_columns = validate_required_columns('wip_worksheet', column_mapping, required_columns)
+    
+    if not is_valid:
+        raise ValueError(f"Required columns missing: {missing_columns}. Available columns: {list(df.columns)}")
+    
+    return df
+
+
+def normalize_job_numbers(job_numbers: pd.Series) -> pd.Series:
+    """
+    Convert job numbers to trimmed strings, Arrow-backed when pyarrow is available.
+    
+    A column that already has the Arrow string dtype is only stripped, without
+    the conversions, so normalizing at load time makes the later calls cheap.
+    
+    Args:
+        job_numbers (pd.Series): Job Number column (any dtype)
+        
+    Returns:
+        pd.Series: Trimmed job numbers
+    """
+    if JOB_NUMBER_DTYPE is not None and job_numbers.dtype == JOB_NUMBER_DTYPE:
+        return job_numbers.str.strip()
+    job_numbers = job_numbers.astype(str).str.strip()
+    if JOB_NUMBER_DTYPE is not None:
+        job_numbers = job_numbers.astype(JOB_NUMBER_DTYPE)
+    return job_numbers
+
+
 def trim_job_numbers(df: pd.DataFrame) -> pd.DataFrame:
     """
     Trim whitespace from Job Number column.
@@ -60,7 +110,7 @@ def trim_job_numbers(df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: WIP data with trimmed job numbers
     """
     df = df.copy()
-    df['Job Number'] = df['Job Number'].astype(str).str.strip()
+    df['Job Number'] = normalize_job_numbers(df['Job Number'])
     
     logging.info("Trimmed whitespace from Job Number column")
     return df
@@ -81,10 +131,11 @@ def filter_closed_jobs(df: pd.DataFrame, include_closed: bool = False) -> pd.Dat
         logging.info("Including all jobs (including closed)")
         return df
     
-    # Filter out closed jobs (case insensitive)
-    df = df.copy()
-    df['Status'] = df['Status'].astype(str).str.lower()
-    filtered_df = df[df['Status'] != 'closed'].copy()
+    # Filter out closed jobs (case insensitive). The Status column is lowered
+    # once, and only the kept rows are copied, not the whole frame first.
+    status = df['Status'].astype(str).str.lower()
+    is_open = status != 'closed'
+    filtered_df = df[is_open].assign(Status=status[is_open])
     
     closed_count = len(df) - len(filtered_df)
     logging.info(f"Filtered out {closed_count} closed jobs. Remaining: {len(filtered_df)} jobs")
@@ -104,15 +155,25 @@ def merge_wip_with_gl(wip_df: pd.DataFrame, gl_df: pd.DataFrame,
         
     Returns:
         pd.DataFrame: Merged WIP and GL data
+        
+    Raises:
+        pd.errors.MergeError: If the GL data has more than one row for a job
     """
-    # Ensure both dataframes have trimmed job numbers
-    wip_df = wip_df.copy()
-    gl_df = gl_df.copy()
+    # Ensure both dataframes have trimmed job numbers (assign returns new
+    # frames, so the callers' frames are left untouched)
+    wip_df = wip_df.assign(**{'Job Number': normalize_job_numbers(wip_df['Job Number'])})
+    gl_df = gl_df.assign(**{'Job Number': normalize_job_numbers(gl_df['Job Number'])})
     
-    wip_df['Job Number'] = wip_df['Job Number'].astype(str).str.strip()
-    gl_df['Job Number'] = gl_df['Job Number'].astype(str).str.strip()
+    # The GL data must have one row per job, or the join would repeat WIP rows
+    # and double count their amounts. merge's validate='m:1' checks the same
+    # thing; checking here lets the error name the duplicated jobs.
+    duplicated_jobs = gl_df['Job Number'][gl_df['Job Number'].duplicated()]
+    if not duplicated_jobs.empty:
+        raise pd.errors.MergeError(
+            f"GL data has more than one row for jobs: {duplicated_jobs.unique().tolist()[:10]}")
     
-    # Perform left join
+    # Perform left join (merge factorizes the string keys into integer codes
+    # itself, so they aren't pre-factorized here)
     merged_df = pd.merge(wip_df, gl_df, on='Job Number', how='left')
     
     # Fill missing GL values with 0 if requested
@@ -158,14 +219,15 @@ def compute_variances(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def process_wip_merge(wip_file_path: str, gl_df: pd.DataFrame, 
+def process_wip_merge(wip_file: Union[str, BinaryIO, pd.DataFrame], gl_df: pd.DataFrame, 
                       include_closed: bool = False,
                       fill_missing_with_zero: bool = True) -> pd.DataFrame:
     """
     Complete processing pipeline for merging WIP Worksheet with GL data.
     
     Args:
-        wip_file_path (str): Path to the WIP Worksheet Excel file
+        wip_file (Union[str, BinaryIO, pd.DataFrame]): Path to the WIP Worksheet
+            Excel file, a binary file-like object holding it, or already loaded WIP data
         gl_df (pd.DataFrame): Aggregated GL data
         include_closed (bool): Whether to include closed jobs
         fill_missing_with_zero (bool): Whether to fill missing GL values with 0
@@ -173,8 +235,13 @@ def process_wip_merge(wip_file_path: str, gl_df: pd.DataFrame,
     Returns:
         pd.DataFrame: Processed and merged data
     """
-    # Load WIP Worksheet
-    wip_data = load_wip_worksheet(wip_file_path)
+    # Load WIP Worksheet, or standardize already loaded data the same way
+    # (the steps below copy before modifying, so the caller's DataFrame is
+    # left untouched)
+    if isinstance(wip_file, pd.DataFrame):
+        wip_data = standardize_wip_columns(wip_file)
+    else:
+        wip_data = load_wip_worksheet(wip_file)
     
     # Trim job numbers
     wip_data = trim_job_numbers(wip_data)
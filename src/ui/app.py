@@ -18,7 +18,7 @@ from data_processing.aggregation import aggregate_gl_data
 from data_processing.merge_data import process_wip_merge, compute_variances
 from data_processing.column_mapping import map_dataframe_columns
 from data_processing.excel_integration_v2 import (
-    load_wip_workbook, find_or_create_monthly_tab, find_section_markers,
+    load_wip_workbook, find_monthly_tab, find_section_markers,
     create_backup, update_wip_report_v2
 )
 
@@ -446,12 +446,15 @@ def display_excel_preview(options):
             with open(temp_path, "wb") as f:
                 f.write(master_file_bytes)
             
-            # Load workbook and find sections
-            wb = load_wip_workbook(temp_path)
-            ws = find_or_create_monthly_tab(wb, options['month_year'])
+            # Load workbook and find sections (read-only: the preview only
+            # looks at values, and a tab that doesn't exist yet would be
+            # created blank, without sections)
+            wb = load_wip_workbook(temp_path, read_only=True)
+            ws = find_monthly_tab(wb, options['month_year'])
             
             # Find sections
-            section_markers = find_section_markers(ws, ["5040", "5030"])
+            section_markers = find_section_markers(ws, ["5040", "5030"]) if ws is not None else {}
+            wb.close()
             section_5040_row = section_markers.get("5040", (None, None))[0] if section_markers.get("5040") else None
             section_5030_row = section_markers.get("5030", (None, None))[0] if section_markers.get("5030") else None
             
@@ -272,14 +272,8 @@ def process_data(options):
             status_text.text("🔗 Merging GL and WIP data...")
             progress_bar.progress(60)
             
-            # Save WIP data to memory buffer for processing
-            wip_buffer = io.BytesIO()
-            wip_df.to_excel(wip_buffer, index=False)
-            wip_buffer.seek(0)
-            
-            # Process merge using buffer
-            merged_df = process_wip_merge_from_buffer(wip_buffer, gl_aggregated, include_closed=options['include_closed'])
-            wip_buffer.close()
+            # Process merge directly on the mapped WIP data
+            merged_df = process_wip_merge_from_dataframe(wip_df, gl_aggregated, include_closed=options['include_closed'])
             
             progress_bar.progress(100)
             status_text.text("✅ Data processing complete!")
@@ -290,11 +284,8 @@ def process_data(options):
         st.error(f"Error processing data: {str(e)}")
         return None, None
 
-def process_wip_merge_from_buffer(wip_buffer, gl_aggregated, include_closed=False):
-    """Process WIP merge from memory buffer instead of file"""
-    # Read from buffer
-    wip_df = pd.read_excel(wip_buffer)
-    
+def process_wip_merge_from_dataframe(wip_df, gl_aggregated, include_closed=False):
+    """Process WIP merge from loaded data instead of file (no XLSX round-trip)"""
     # Import the original merge function logic here
     from data_processing.merge_data import trim_job_numbers, merge_wip_with_gl, filter_closed_jobs
     
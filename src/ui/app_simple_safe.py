@@ -5,11 +5,28 @@ This version focuses on safe, data-only updates without complex preservation
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import io
 from datetime import datetime
 from pathlib import Path
 import logging
+import xlsxwriter
+
+# Import our modules
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from data_processing.aggregation import match_account_filters
+from data_processing.excel_reader import read_excel_values_many
+
+# pyarrow is optional; without it the Feather download is simply not offered
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,6 +40,23 @@ def initialize_session_state():
         st.session_state.processing_complete = False
     if 'merged_data' not in st.session_state:
         st.session_state.merged_data = None
+    if 'file_bytes' not in st.session_state:
+        st.session_state.file_bytes = {}
+
+def store_uploaded_file(key, uploaded_file):
+    """Remember an upload and copy its bytes out once per distinct file"""
+    st.session_state.files_uploaded[key] = uploaded_file
+    
+    # getvalue() returns a fresh copy of the whole upload, so only take one
+    # when the file actually changed rather than on every rerun
+    upload_id = getattr(uploaded_file, 'file_id', None) or (uploaded_file.name, uploaded_file.size)
+    stored = st.session_state.file_bytes.get(key)
+    if stored is None or stored[0] != upload_id:
+        st.session_state.file_bytes[key] = (upload_id, uploaded_file.getvalue())
+
+def get_uploaded_bytes(key):
+    """Return the stored bytes of an uploaded file"""
+    return st.session_state.file_bytes[key][1]
 
 def display_file_upload_section():
     """Display file upload widgets"""
@@ -38,7 +72,7 @@ def display_file_upload_section():
             key='master_report'
         )
         if master_file:
-            st.session_state.files_uploaded['master_report'] = master_file
+            store_uploaded_file('master_report', master_file)
             st.success(f"✅ {master_file.name}")
     
     with col2:
@@ -49,7 +83,7 @@ def display_file_upload_section():
             key='wip_worksheet'
         )
         if wip_file:
-            st.session_state.files_uploaded['wip_worksheet'] = wip_file
+            store_uploaded_file('wip_worksheet', wip_file)
             st.success(f"✅ {wip_file.name}")
     
     with col3:
@@ -60,88 +94,144 @@ def display_file_upload_section():
             key='gl_inquiry'
         )
         if gl_file:
-            st.session_state.files_uploaded['gl_inquiry'] = gl_file
+            store_uploaded_file('gl_inquiry', gl_file)
             st.success(f"✅ {gl_file.name}")
     
     return len(st.session_state.files_uploaded) == 3
 
-def process_gl_data(gl_file_bytes):
-    """Process GL inquiry data"""
+@st.cache_data(show_spinner=False, max_entries=4, ttl=3600)
+def read_excel_bytes_many(file_bytes_list):
+    """Parse several Excel files (cached on the files' bytes)"""
+    return read_excel_values_many(file_bytes_list)
+
+@st.cache_data(show_spinner=False, max_entries=4, ttl=3600)
+def process_gl_data(gl_df):
+    """Process GL inquiry data (cached on the parsed GL data; errors are raised, not cached)"""
+    # Simple column mapping
+    if 'JobNumber' in gl_df.columns:
+        gl_df = gl_df.rename(columns={'JobNumber': 'Job Number'})
+    
+    # Filter for accounts containing our target strings
+    account_filters = ['5040', '5030', '4020']
+    mask = match_account_filters(gl_df['Account'], account_filters)
+    
+    # Project to the columns we aggregate before filtering so only the
+    # matching rows of those columns are materialized
+    filtered_gl = gl_df.loc[mask, ['Job Number', 'Debit', 'Credit']]
+    
+    # Compute Amount = Debit + Credit and sum it per job: factorize the
+    # job numbers once and let np.bincount do the weighted sum in one pass
+    amounts = (filtered_gl['Debit'].to_numpy(dtype=float, na_value=0.0)
+               + filtered_gl['Credit'].to_numpy(dtype=float, na_value=0.0))
+    job_codes, job_numbers = pd.factorize(filtered_gl['Job Number'], sort=True)
+    has_job = job_codes >= 0
+    gl_summary = pd.DataFrame({
+        'Job Number': job_numbers,
+        'Amount': np.bincount(job_codes[has_job], weights=amounts[has_job], minlength=len(job_numbers))
+    })
+    
+    st.info(f"✅ Processed {len(gl_summary)} GL job entries from {len(filtered_gl)} records")
+    return gl_summary
+
+@st.cache_data(show_spinner=False, max_entries=4, ttl=3600)
+def process_wip_data(wip_df, gl_summary, include_closed=False):
+    """Process WIP worksheet and merge with GL data (cached on inputs and options; errors are raised, not cached)"""
+    # Simple column mapping
+    if 'JobNumber' in wip_df.columns:
+        wip_df = wip_df.rename(columns={'JobNumber': 'Job Number'})
+    
+    # Filter closed jobs if requested (before trimming, so only the
+    # remaining rows get their job numbers rewritten)
+    if not include_closed and 'Status' in wip_df.columns:
+        original_count = len(wip_df)
+        # Only a handful of distinct statuses exist, so uppercase those and
+        # broadcast the result back to the rows through the factorized codes
+        status_codes, statuses = pd.factorize(wip_df['Status'].astype(str), use_na_sentinel=False)
+        is_closed = pd.Series(statuses).str.upper().eq('CLOSED').to_numpy(dtype=bool)
+        wip_df = wip_df[~is_closed[status_codes]]
+        st.info(f"📋 Filtered out {original_count - len(wip_df)} closed jobs")
+    
+    # Trim job numbers
+    wip_df = wip_df.assign(**{'Job Number': wip_df['Job Number'].astype(str).str.strip()})
+    gl_summary = gl_summary.assign(**{'Job Number': gl_summary['Job Number'].astype(str).str.strip()})
+    
+    # Merge with GL data (merge factorizes the string keys itself)
+    merged_df = wip_df.merge(gl_summary, on='Job Number', how='left', suffixes=('', '_GL'))
+    merged_df['Amount'] = merged_df['Amount'].fillna(0)
+    
+    st.info(f"✅ Merged {len(wip_df)} WIP jobs with {len(gl_summary)} GL entries")
+    return merged_df
+
+def create_simple_csv_output(merged_df):
+    """Create a simple CSV output instead of Excel modification"""
     try:
-        # Load GL data
-        gl_df = pd.read_excel(io.BytesIO(gl_file_bytes))
-        
-        # Simple column mapping
-        if 'JobNumber' in gl_df.columns:
-            gl_df = gl_df.rename(columns={'JobNumber': 'Job Number'})
-        
-        # Filter for accounts containing our target strings
-        account_filters = ['5040', '5030', '4020']
-        mask = gl_df['Account'].astype(str).str.contains('|'.join(account_filters), na=False)
-        filtered_gl = gl_df[mask].copy()
-        
-        # Compute Amount = Debit + Credit
-        filtered_gl['Amount'] = filtered_gl['Debit'].fillna(0) + filtered_gl['Credit'].fillna(0)
+        # Create output data focused on key fields
+        # Derive both split columns from one float array in a single assign,
+        # instead of copying the frame and inserting the columns one by one
+        amount = merged_df['Amount'].to_numpy(dtype=float)
+        output_df = merged_df[['Job Number', 'Amount']].assign(
+            Labor_Cost=amount * 0.6,  # Example split
+            Material_Cost=amount * 0.4  # Example split
+        )
         
-        # Group by Job Number and sum amounts
-        gl_summary = filtered_gl.groupby('Job Number')['Amount'].sum().reset_index()
+        # Convert to CSV
+        csv_buffer = io.StringIO()
+        output_df.to_csv(csv_buffer, index=False)
+        csv_data = csv_buffer.getvalue()
+        csv_buffer.close()
         
-        st.info(f"✅ Processed {len(gl_summary)} GL job entries from {len(filtered_gl)} records")
-        return gl_summary
+        return csv_data
         
     except Exception as e:
-        st.error(f"Error processing GL data: {str(e)}")
+        st.error(f"Error creating CSV output: {str(e)}")
         return None
 
-def process_wip_data(wip_file_bytes, gl_summary, include_closed=False):
-    """Process WIP worksheet and merge with GL data"""
+def create_simple_excel_output(merged_df):
+    """Create a simple Excel output, streamed row by row with xlsxwriter"""
     try:
-        # Load WIP data
-        wip_df = pd.read_excel(io.BytesIO(wip_file_bytes))
-        
-        # Simple column mapping
-        if 'JobNumber' in wip_df.columns:
-            wip_df = wip_df.rename(columns={'JobNumber': 'Job Number'})
-        
-        # Trim job numbers
-        wip_df['Job Number'] = wip_df['Job Number'].astype(str).str.strip()
-        gl_summary['Job Number'] = gl_summary['Job Number'].astype(str).str.strip()
+        excel_buffer = io.BytesIO()
         
-        # Filter closed jobs if requested
-        if not include_closed and 'Status' in wip_df.columns:
-            original_count = len(wip_df)
-            wip_df = wip_df[wip_df['Status'].astype(str).str.upper() != 'CLOSED']
-            st.info(f"📋 Filtered out {original_count - len(wip_df)} closed jobs")
+        # constant_memory flushes each row as soon as the next one starts, so
+        # memory stays flat regardless of row count. Rows have to be written
+        # in order, which pandas' to_excel (column by column) does not do, so
+        # the rows are written directly
+        workbook = xlsxwriter.Workbook(excel_buffer, {'constant_memory': True, 'in_memory': False, 'default_date_format': 'yyyy-mm-dd'})
+        worksheet = workbook.add_worksheet('Results')
+        worksheet.write_row(0, 0, [str(column) for column in merged_df.columns])
         
-        # Merge with GL data
-        merged_df = wip_df.merge(gl_summary, on='Job Number', how='left', suffixes=('', '_GL'))
-        merged_df['Amount'] = merged_df['Amount'].fillna(0)
+        # Blank out missing values, which xlsxwriter can't write as numbers
+        values = merged_df.astype(object).where(merged_df.notna(), None)
+        for row_idx, row in enumerate(values.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_idx, 0, row)
         
-        st.info(f"✅ Merged {len(wip_df)} WIP jobs with {len(gl_summary)} GL entries")
-        return merged_df
+        workbook.close()
+        return excel_buffer.getvalue()
         
     except Exception as e:
-        st.error(f"Error processing WIP data: {str(e)}")
+        st.error(f"Error creating Excel output: {str(e)}")
         return None
 
-def create_simple_csv_output(merged_df):
-    """Create a simple CSV output instead of Excel modification"""
+@st.cache_data(show_spinner=False, max_entries=4, ttl=3600)
+def build_feather_bytes(merged_df):
+    """Write the results as Arrow Feather (cached on the results; errors are raised, not cached)"""
+    df = merged_df.reset_index(drop=True)
+    
+    # Free-text columns from Excel often mix numbers and strings, which Arrow
+    # can't store in one column, so write their non-missing values as text
+    object_columns = df.select_dtypes(include='object').columns
+    df = df.assign(**{col: df[col].where(df[col].isna(), df[col].astype(str)) for col in object_columns})
+    
+    feather_buffer = io.BytesIO()
+    df.to_feather(feather_buffer, compression='zstd')
+    return feather_buffer.getvalue()
+
+def create_feather_output(merged_df):
+    """Create an Arrow Feather output, or None (logged) if the results can't be written as Arrow"""
     try:
-        # Create output data focused on key fields
-        output_df = merged_df[['Job Number', 'Amount']].copy()
-        output_df['Labor_Cost'] = output_df['Amount'] * 0.6  # Example split
-        output_df['Material_Cost'] = output_df['Amount'] * 0.4  # Example split
-        
-        # Convert to CSV
-        csv_buffer = io.StringIO()
-        output_df.to_csv(csv_buffer, index=False)
-        csv_data = csv_buffer.getvalue()
-        csv_buffer.close()
-        
-        return csv_data
+        return build_feather_bytes(merged_df)
         
     except Exception as e:
-        st.error(f"Error creating CSV output: {str(e)}")
+        logger.warning(f"Feather output not offered: {str(e)}")
         return None
 
 def main():
@@ -178,20 +268,29 @@ def main():
     if st.button("🔄 Process Data", type="primary"):
         with st.spinner("Processing data..."):
             
-            # Process GL data
-            gl_file_bytes = st.session_state.files_uploaded['gl_inquiry'].getvalue()
-            gl_summary = process_gl_data(gl_file_bytes)
+            # Load both exports side by side (parsed once per file, so
+            # toggling options only re-runs the processing below)
+            gl_file_bytes = get_uploaded_bytes('gl_inquiry')
+            wip_file_bytes = get_uploaded_bytes('wip_worksheet')
+            try:
+                gl_df, wip_df = read_excel_bytes_many([gl_file_bytes, wip_file_bytes])
+            except Exception as e:
+                st.error(f"❌ Failed to read uploaded files: {str(e)}")
+                return
             
-            if gl_summary is None:
-                st.error("❌ Failed to process GL data")
+            # Process GL data (reported here, so a failure isn't cached and
+            # re-running retries it)
+            try:
+                gl_summary = process_gl_data(gl_df)
+            except Exception as e:
+                st.error(f"❌ Failed to process GL data: {str(e)}")
                 return
             
             # Process WIP data
-            wip_file_bytes = st.session_state.files_uploaded['wip_worksheet'].getvalue()
-            merged_df = process_wip_data(wip_file_bytes, gl_summary, include_closed)
-            
-            if merged_df is None:
-                st.error("❌ Failed to process WIP data")
+            try:
+                merged_df = process_wip_data(wip_df, gl_summary, include_closed)
+            except Exception as e:
+                st.error(f"❌ Failed to process WIP data: {str(e)}")
                 return
             
             # Store results
@@ -235,17 +334,26 @@ def main():
             )
         
         # Excel Download (Simple)
-        excel_buffer = io.BytesIO()
-        with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-            merged_df.to_excel(writer, sheet_name='Results', index=False)
-        excel_buffer.seek(0)
+        excel_data = create_simple_excel_output(merged_df)
+        if excel_data:
+            st.download_button(
+                "📊 Download Excel Results",
+                data=excel_data,
+                file_name=f"WIP_Results_{month_year.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
         
-        st.download_button(
-            "📊 Download Excel Results",
-            data=excel_buffer.getvalue(),
-            file_name=f"WIP_Results_{month_year.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
+        # Feather Download (Arrow, skips cell-by-cell XLSX serialization). Only
+        # built once asked for, and the button is left out if it can't be built
+        if PYARROW_AVAILABLE and st.checkbox("Offer Arrow Feather download"):
+            feather_data = create_feather_output(merged_df)
+            if feather_data:
+                st.download_button(
+                    "📦 Download Arrow Feather Results",
+                    data=feather_data,
+                    file_name=f"WIP_Results_{month_year.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.feather",
+                    mime="application/vnd.apache.arrow.file"
+                )
         
         # Instructions for manual update
         st.subheader("📋 Manual Update Instructions")
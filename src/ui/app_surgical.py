@@ -12,6 +12,7 @@ Key Features:
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import io
 import logging
@@ -28,6 +29,7 @@ from data_processing.aggregation import (
     aggregate_gl_data
 )
 from data_processing.merge_data import merge_wip_with_gl
+from data_processing.excel_reader import read_excel_values, read_excel_values_many
 from data_processing.excel_surgical import (
     update_wip_report_surgical, 
     create_backup_from_bytes,
@@ -45,17 +47,72 @@ st.set_page_config(
     layout="wide"
 )
 
-def load_and_validate_file(uploaded_file, file_type="Excel"):
-    """Load and validate uploaded file"""
+# Accepted header variations for each standard column, in priority order
+GL_COLUMN_VARIATIONS = {
+    'Account': ['Account', 'Account Number', 'Acct', 'GL Account'],
+    'Job Number': ['Job Number', 'Job No', 'Job #', 'Job', 'Project Number'],
+    'Debit': ['Debit', 'Debit Amount', 'DR', 'Dr'],
+    'Credit': ['Credit', 'Credit Amount', 'CR', 'Cr']
+}
+
+WIP_COLUMN_VARIATIONS = {
+    'Job Number': ['Job Number', 'Job No', 'Job #', 'Job', 'Project Number', 'Project No'],
+    'Status': ['Status', 'Job Status', 'Project Status', 'State'],
+    'Job Name': ['Job Name', 'Project Name', 'Description', 'Job Description'],
+    'Budget Material': ['Budget Material', 'Material Budget', 'Mat Budget', 'Budget Mat'],
+    'Budget Labor': ['Budget Labor', 'Labor Budget', 'Lab Budget', 'Budget Lab'],
+    'Actual Material': ['Actual Material', 'Material Actual', 'Mat Actual', 'Actual Mat'],
+    'Actual Labor': ['Actual Labor', 'Labor Actual', 'Lab Actual', 'Actual Lab']
+}
+
+# Reverse lookups {variation: (standard_name, priority)}, built once so mapping
+# a sheet is a single pass over its columns
+GL_REVERSE = {
+    variation: (standard_name, priority)
+    for standard_name, variations in GL_COLUMN_VARIATIONS.items()
+    for priority, variation in enumerate(variations)
+}
+WIP_REVERSE = {
+    variation: (standard_name, priority)
+    for standard_name, variations in WIP_COLUMN_VARIATIONS.items()
+    for priority, variation in enumerate(variations)
+}
+
+def resolve_column_mapping(columns, reverse_lookup):
+    """Map sheet columns to standard names, preferring the earliest listed variation"""
+    best = {}
+    for column in columns:
+        match = reverse_lookup.get(column)
+        if match is not None:
+            standard_name, priority = match
+            if standard_name not in best or priority < best[standard_name][1]:
+                best[standard_name] = (column, priority)
+    
+    return {column: standard_name for standard_name, (column, _) in best.items()}
+
+@st.cache_data(show_spinner=False, max_entries=4, ttl=3600)
+def read_excel_bytes(file_bytes):
+    """Parse the first sheet of an Excel file (cached on the file's bytes)"""
+    return read_excel_values(file_bytes)
+
+@st.cache_data(show_spinner=False, max_entries=4, ttl=3600)
+def read_excel_bytes_many(file_bytes_list):
+    """Parse several Excel files (cached on the files' bytes)"""
+    return read_excel_values_many(file_bytes_list)
+
+def load_and_validate_file(uploaded_file, file_type="Excel", parsed_df=None):
+    """Load and validate uploaded file, reusing parsed_df if it was already parsed"""
     if uploaded_file is None:
         return None, None
         
     try:
-        file_bytes = uploaded_file.read()
+        # getvalue() returns the full contents regardless of read position,
+        # so the bytes (and the parse cache key) are stable across reruns
+        file_bytes = uploaded_file.getvalue()
         
         if file_type == "Excel":
             # Try to load as Excel to validate
-            df = pd.read_excel(io.BytesIO(file_bytes), sheet_name=0)
+            df = parsed_df if parsed_df is not None else read_excel_bytes(file_bytes)
             return file_bytes, df
         else:
             return file_bytes, None
@@ -65,7 +122,7 @@ def load_and_validate_file(uploaded_file, file_type="Excel"):
         return None, None
 
 def display_file_upload_section():
-    """Display file upload widgets and return file data"""
+    """Display file upload widgets and return the master bytes and parsed WIP/GL data"""
     st.header("📁 File Upload")
     
     col1, col2, col3 = st.columns(3)
@@ -77,12 +134,6 @@ def display_file_upload_section():
             type=['xlsx', 'xlsm'],
             key="master"
         )
-        
-        if master_file:
-            st.success(f"✅ {master_file.name}")
-            master_bytes, _ = load_and_validate_file(master_file, "Master")
-        else:
-            master_bytes = None
     
     with col2:
         st.subheader("WIP Worksheet Export")  
@@ -91,12 +142,6 @@ def display_file_upload_section():
             type=['xlsx'],
             key="wip"
         )
-        
-        if wip_file:
-            st.success(f"✅ {wip_file.name}")
-            wip_bytes, wip_df = load_and_validate_file(wip_file, "Excel")
-        else:
-            wip_bytes, wip_df = None, None
     
     with col3:
         st.subheader("GL Inquiry Export")
@@ -105,14 +150,41 @@ def display_file_upload_section():
             type=['xlsx'], 
             key="gl"
         )
-        
+    
+    # Parse the two exports side by side once both are uploaded
+    parsed = {}
+    if wip_file and gl_file:
+        try:
+            parsed['wip'], parsed['gl'] = read_excel_bytes_many([wip_file.getvalue(), gl_file.getvalue()])
+        except Exception as e:
+            # Fall back to parsing each file below, which reports the one that failed
+            logger.warning(f"Parallel parse failed: {e}")
+            parsed = {}
+    
+    with col1:
+        if master_file:
+            st.success(f"✅ {master_file.name}")
+            master_bytes, _ = load_and_validate_file(master_file, "Master")
+        else:
+            master_bytes = None
+    
+    with col2:
+        if wip_file:
+            st.success(f"✅ {wip_file.name}")
+            _, wip_df = load_and_validate_file(wip_file, "Excel", parsed.get('wip'))
+        else:
+            wip_df = None
+    
+    with col3:
         if gl_file:
             st.success(f"✅ {gl_file.name}")
-            gl_bytes, gl_df = load_and_validate_file(gl_file, "Excel")
+            _, gl_df = load_and_validate_file(gl_file, "Excel", parsed.get('gl'))
         else:
-            gl_bytes, gl_df = None, None
+            gl_df = None
     
-    return master_bytes, wip_bytes, gl_bytes
+    # The DataFrames parsed during validation are handed straight to
+    # processing, so each upload is only parsed once
+    return master_bytes, wip_df, gl_df
 
 def display_settings_section():
     """Display settings and options"""
@@ -140,88 +212,58 @@ def display_settings_section():
     
     return month_year, include_closed
 
-def process_data(wip_bytes, gl_bytes, include_closed):
-    """Process the data using our existing functions"""
-    try:
-        with st.spinner("Processing GL data..."):
-            # Load GL inquiry from bytes
-            gl_df = pd.read_excel(io.BytesIO(gl_bytes))
-            
-            # Apply column mapping (like load_gl_inquiry does)
-            column_variations = {
-                'Account': ['Account', 'Account Number', 'Acct', 'GL Account'],
-                'Job Number': ['Job Number', 'Job No', 'Job #', 'Job', 'Project Number'],
-                'Debit': ['Debit', 'Debit Amount', 'DR', 'Dr'],
-                'Credit': ['Credit', 'Credit Amount', 'CR', 'Cr']
-            }
-            
-            # Map column names to standard names
-            column_mapping = {}
-            for standard_name, variations in column_variations.items():
-                found_column = None
-                for variation in variations:
-                    if variation in gl_df.columns:
-                        found_column = variation
-                        break
-                
-                if found_column:
-                    column_mapping[found_column] = standard_name
-                else:
-                    raise ValueError(f"Required column '{standard_name}' not found. Available columns: {list(gl_df.columns)}")
-            
-            # Rename columns to standard names
-            gl_df = gl_df.rename(columns=column_mapping)
-            
-            # Process GL data step by step (instead of using the file-path version)
-            filtered_gl = filter_gl_accounts(gl_df)
-            amounts_gl = compute_amounts(filtered_gl)
-            gl_summary = aggregate_gl_data(amounts_gl)
-            
-            st.info(f"✅ Processed {len(gl_summary)} GL entries")
-            
-        with st.spinner("Merging data..."):
-            # Load WIP worksheet from bytes
-            wip_df = pd.read_excel(io.BytesIO(wip_bytes))
-            
-            # Apply column mapping for WIP worksheet
-            wip_column_variations = {
-                'Job Number': ['Job Number', 'Job No', 'Job #', 'Job', 'Project Number', 'Project No'],
-                'Status': ['Status', 'Job Status', 'Project Status', 'State'],
-                'Job Name': ['Job Name', 'Project Name', 'Description', 'Job Description'],
-                'Budget Material': ['Budget Material', 'Material Budget', 'Mat Budget', 'Budget Mat'],
-                'Budget Labor': ['Budget Labor', 'Labor Budget', 'Lab Budget', 'Budget Lab'],
-                'Actual Material': ['Actual Material', 'Material Actual', 'Mat Actual', 'Actual Mat'],
-                'Actual Labor': ['Actual Labor', 'Labor Actual', 'Lab Actual', 'Actual Lab']
-            }
-            
-            # Map WIP column names to standard names
-            wip_column_mapping = {}
-            for standard_name, variations in wip_column_variations.items():
-                found_column = None
-                for variation in variations:
-                    if variation in wip_df.columns:
-                        found_column = variation
-                        break
-                
-                if found_column:
-                    wip_column_mapping[found_column] = standard_name
-                else:
-                    # Some columns might be optional, only require Job Number and Status
-                    if standard_name in ['Job Number', 'Status']:
-                        raise ValueError(f"Required WIP column '{standard_name}' not found. Available columns: {list(wip_df.columns)}")
-            
-            # Rename WIP columns to standard names
-            wip_df = wip_df.rename(columns=wip_column_mapping)
-            
-            merged_df = merge_wip_with_gl(wip_df, gl_summary, include_closed)
-            st.info(f"✅ Merged data for {len(merged_df)} jobs")
-            
-        return merged_df
+@st.cache_data(show_spinner=False, max_entries=4, ttl=3600)
+def process_data(wip_df, gl_df, include_closed):
+    """Process the data using our existing functions (cached on inputs and options; errors are raised, not cached)"""
+    with st.spinner("Processing GL data..."):
+        # Map column names to standard names (like load_gl_inquiry does)
+        column_mapping = resolve_column_mapping(gl_df.columns, GL_REVERSE)
         
-    except Exception as e:
-        st.error(f"Error processing data: {str(e)}")
-        logger.error(f"Processing error: {e}")
-        return None
+        missing = [name for name in GL_COLUMN_VARIATIONS if name not in column_mapping.values()]
+        if missing:
+            raise ValueError(f"Required column '{missing[0]}' not found. Available columns: {list(gl_df.columns)}")
+        
+        # Rename columns to standard names and keep only the columns the
+        # aggregation uses, so filtering does not copy unused columns
+        gl_df = gl_df.rename(columns=column_mapping)[list(GL_COLUMN_VARIATIONS)]
+
+        # Process GL data step by step (instead of using the file-path version)
+        filtered_gl = filter_gl_accounts(gl_df)
+        amounts_gl = compute_amounts(filtered_gl)
+        gl_summary = aggregate_gl_data(amounts_gl)
+        
+        st.info(f"✅ Processed {len(gl_summary)} GL entries")
+        
+    with st.spinner("Merging data..."):
+        # Map WIP column names to standard names
+        wip_column_mapping = resolve_column_mapping(wip_df.columns, WIP_REVERSE)
+        
+        # Some columns might be optional, only require Job Number and Status
+        for standard_name in ['Job Number', 'Status']:
+            if standard_name not in wip_column_mapping.values():
+                raise ValueError(f"Required WIP column '{standard_name}' not found. Available columns: {list(wip_df.columns)}")
+        
+        # Rename WIP columns to standard names
+        wip_df = wip_df.rename(columns=wip_column_mapping)
+        
+        merged_df = merge_wip_with_gl(wip_df, gl_summary, include_closed)
+        st.info(f"✅ Merged data for {len(merged_df)} jobs")
+        
+    return merged_df
+
+@st.cache_data(show_spinner=False, max_entries=4, ttl=3600)
+def compute_preview_stats(merged_df):
+    """Compute the preview metrics in one pass over the Sub Labor and Material columns"""
+    # Missing columns count as zero
+    values = merged_df.reindex(columns=['Sub Labor', 'Material'], fill_value=0).to_numpy(dtype=float)
+    
+    return {
+        'total_jobs': len(merged_df),
+        'total_labor': float(np.nansum(values[:, 0])),
+        'total_material': float(np.nansum(values[:, 1])),
+        # Non-zero entries across both columns
+        'active_entries': int(np.count_nonzero(values))
+    }
 
 def display_preview_section(merged_df):
     """Display data preview"""
@@ -229,21 +271,17 @@ def display_preview_section(merged_df):
         st.header("👀 Data Preview")
         
         # Summary stats
+        stats = compute_preview_stats(merged_df)
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Jobs", len(merged_df))
+            st.metric("Total Jobs", stats['total_jobs'])
         with col2:
-            total_labor = merged_df.get('Sub Labor', pd.Series([0])).sum()
-            st.metric("Total Sub Labor", f"${total_labor:,.2f}")
+            st.metric("Total Sub Labor", f"${stats['total_labor']:,.2f}")
         with col3:
-            total_material = merged_df.get('Material', pd.Series([0])).sum()
-            st.metric("Total Material", f"${total_material:,.2f}")
+            st.metric("Total Material", f"${stats['total_material']:,.2f}")
         with col4:
-            # Count non-zero entries
-            non_zero_labor = (merged_df.get('Sub Labor', pd.Series([0])) != 0).sum()
-            non_zero_material = (merged_df.get('Material', pd.Series([0])) != 0).sum()
-            st.metric("Active Entries", f"{non_zero_labor + non_zero_material}")
+            st.metric("Active Entries", f"{stats['active_entries']}")
         
         # Data table
         st.subheader("Merged Data")
@@ -252,6 +290,11 @@ def display_preview_section(merged_df):
         return True
     return False
 
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def locate_sections(master_bytes, month_year):
+    """Find the 5040/5030 section rows (cached on the master file's bytes and tab name)"""
+    return find_section_locations(master_bytes, month_year)
+
 def display_processing_section(master_bytes, merged_df, month_year):
     """Display processing section and handle Excel updates"""
     if master_bytes and merged_df is not None:
@@ -259,7 +302,7 @@ def display_processing_section(master_bytes, merged_df, month_year):
         
         # Show section detection first
         with st.spinner("Detecting Excel sections..."):
-            row_5040, row_5030 = find_section_locations(master_bytes, month_year)
+            row_5040, row_5030 = locate_sections(master_bytes, month_year)
             
             if row_5040:
                 st.success(f"✅ Found 5040 section at row {row_5040}")
@@ -343,23 +386,20 @@ def display_download_section(updated_bytes, merged_df):
         with col2:
             # Create simple validation report  
             if merged_df is not None:
-                # Create validation DataFrame
-                validation_data = []
-                for _, row in merged_df.iterrows():
-                    job = row.get('Job Number', '')
-                    material = row.get('Material', 0) or 0
-                    labor = row.get('Sub Labor', 0) or 0
-                    
-                    if material > 1000 or labor > 1000:
-                        validation_data.append({
-                            'Job Number': job,
-                            'Material': material,
-                            'Sub Labor': labor,
-                            'Flag': 'High Value' if (material > 1000 or labor > 1000) else 'Normal'
-                        })
+                # Flag high-value jobs with one vectorized filter
+                zeros = pd.Series(0, index=merged_df.index)
+                material = merged_df.get('Material', zeros).fillna(0)
+                labor = merged_df.get('Sub Labor', zeros).fillna(0)
+                high_value = (material > 1000) | (labor > 1000)
+                
+                validation_df = pd.DataFrame({
+                    'Job Number': merged_df.get('Job Number', pd.Series('', index=merged_df.index))[high_value],
+                    'Material': material[high_value],
+                    'Sub Labor': labor[high_value],
+                    'Flag': 'High Value'
+                })
                 
-                if validation_data:
-                    validation_df = pd.DataFrame(validation_data)
+                if not validation_df.empty:
                     validation_buffer = io.BytesIO()
                     with pd.ExcelWriter(validation_buffer, engine='xlsxwriter') as writer:
                         validation_df.to_excel(writer, index=False, sheet_name='Validation')
@@ -379,18 +419,24 @@ def main():
     st.markdown("### Surgical Excel Edition - Zero Data Loss")
     
     # File uploads
-    master_bytes, wip_bytes, gl_bytes = display_file_upload_section()
+    master_bytes, wip_df, gl_df = display_file_upload_section()
     
     # Check if we have the required files
-    if not all([master_bytes, wip_bytes, gl_bytes]):
+    if not master_bytes or wip_df is None or gl_df is None:
         st.info("👆 Please upload all three Excel files to continue")
         return
     
     # Settings
     month_year, include_closed = display_settings_section()
     
-    # Process data
-    merged_df = process_data(wip_bytes, gl_bytes, include_closed)
+    # Process data (reported here, so a failure isn't cached and re-running
+    # retries it)
+    try:
+        merged_df = process_data(wip_df, gl_df, include_closed)
+    except Exception as e:
+        st.error(f"Error processing data: {str(e)}")
+        logger.error(f"Processing error: {e}")
+        merged_df = None
     
     # Preview
     if display_preview_section(merged_df):
@@ -4,6 +4,7 @@ Test script to validate section positions and job counts in the April 25 tab
 """
 
 import pandas as pd
+import re
 from pathlib import Path
 import sys
 import os
@@ -16,25 +17,31 @@ from data_processing.excel_integration_v2 import (
     find_section_markers
 )
 
-def validate_april_25_tab():
-    """Validate the April 25 tab structure and job counts."""
+# Section codes to look for in header cells (matched anywhere in the text)
+SECTION_RE = re.compile(r'5040|5030')
+
+def validate_april_25_tab(workbook=None):
+    """Validate the April 25 tab structure and job counts. (workbook: an already loaded, read-only Master WIP Report to reuse)"""
     print("🔍 Validating April 25 Tab Structure")
     print("=" * 50)
     
     # Load the Master WIP Report
     master_report_file = Path("test_data") / "Master WIP Report.xlsx"
     
-    if not master_report_file.exists():
+    if workbook is None and not master_report_file.exists():
         print(f"❌ Master WIP Report not found: {master_report_file}")
         return False
     
+    owns_workbook = workbook is None
     try:
-        # Load workbook
-        workbook = load_wip_workbook(str(master_report_file))
-        print(f"✅ Loaded workbook with sheets: {workbook.sheetnames}")
+        # Load workbook (read-only: this script only inspects values)
+        if owns_workbook:
+            workbook = load_wip_workbook(str(master_report_file), read_only=True)
+        sheet_names = workbook.sheetnames
+        print(f"✅ Loaded workbook with sheets: {sheet_names}")
         
         # Check if April 25 tab exists
-        if 'April 25' not in workbook.sheetnames:
+        if 'April 25' not in sheet_names:
             print("❌ 'April 25' tab not found")
             return False
         
@@ -50,40 +57,64 @@ def validate_april_25_tab():
         # Manual verification - let's scan the worksheet more thoroughly
         print("\n📊 Manual verification - scanning worksheet...")
         
+        # Pull every value the checks below look at (rows 1-121, columns A-I)
+        # in one pass instead of fetching cells one at a time
+        grid = [list(values) for values in april_ws.iter_rows(min_row=1, max_row=121, max_col=9, values_only=True)]
+        
+        def cell_value(row, col):
+            if row <= len(grid) and col <= len(grid[row - 1]):
+                return grid[row - 1][col - 1]
+            return None
+        
+        def find_sections(windows):
+            """Return {code: (row, col, value)} for the first cell in each code's row window containing it"""
+            found = {}
+            last_row = min(max(last for _, last in windows.values()), len(grid))
+            # One sweep: the regex pulls every section code out of a cell at once
+            for row in range(1, last_row + 1):
+                for col, value in enumerate(grid[row - 1], start=1):
+                    if not value:
+                        continue
+                    for code in SECTION_RE.findall(str(value)):
+                        first, last = windows[code]
+                        if code not in found and first <= row <= last:
+                            found[code] = (row, col, value)
+                # Section headers are unique, so stop once both are found
+                if len(found) == len(windows):
+                    break
+            return found
+        
+        # 5040 is in the first 20 rows, 5030 around row 69
+        sections = find_sections({'5040': (1, 19), '5030': (50, 79)})
+        
         # Look for 5040 section
         print("Looking for 5040 section (Sub Labor)...")
-        for row in range(1, 20):  # Check first 20 rows
-            for col in range(1, 10):  # Check first 10 columns
-                cell = april_ws.cell(row=row, column=col)
-                if cell.value and '5040' in str(cell.value):
-                    print(f"   Found '5040' at row {row}, col {col}: '{cell.value}'")
+        found_5040 = sections.get('5040')
+        if found_5040:
+            print(f"   Found '5040' at row {found_5040[0]}, col {found_5040[1]}: '{found_5040[2]}'")
         
         # Look for 5030 section
         print("Looking for 5030 section (Material)...")
-        for row in range(50, 80):  # Check around row 69
-            for col in range(1, 10):  # Check first 10 columns
-                cell = april_ws.cell(row=row, column=col)
-                if cell.value and '5030' in str(cell.value):
-                    print(f"   Found '5030' at row {row}, col {col}: '{cell.value}'")
+        found_5030 = sections.get('5030')
+        if found_5030:
+            print(f"   Found '5030' at row {found_5030[0]}, col {found_5030[1]}: '{found_5030[2]}'")
         
         # Count jobs in 5040 section (starting around row 3)
         print(f"\n📋 Counting jobs in 5040 section (starting around row 3)...")
         job_count_5040 = 0
+        consecutive_empty = 0
         for row in range(3, 30):  # Check rows 3-30
-            job_cell = april_ws.cell(row=row, column=1)  # Column A
-            if job_cell.value and str(job_cell.value).strip():
+            job_cell_value = cell_value(row, 1)  # Column A
+            if job_cell_value and str(job_cell_value).strip():
+                consecutive_empty = 0
                 # Check if it looks like a job number
-                job_value = str(job_cell.value).strip()
+                job_value = str(job_cell_value).strip()
                 if job_value and not job_value.lower() in ['job#', 'job', 'total', '']:
                     print(f"   Row {row}, Col A: '{job_value}'")
                     job_count_5040 += 1
             else:
-                # Stop counting when we hit empty rows
-                consecutive_empty = 0
-                for check_row in range(row, row + 3):
-                    check_cell = april_ws.cell(row=check_row, column=1)
-                    if not check_cell.value or not str(check_cell.value).strip():
-                        consecutive_empty += 1
+                # Stop counting after 3 consecutive empty rows
+                consecutive_empty += 1
                 if consecutive_empty >= 3:
                     break
         
@@ -92,21 +123,19 @@ def validate_april_25_tab():
         # Count jobs in 5030 section (starting around row 70)
         print(f"\n📋 Counting jobs in 5030 section (starting around row 70)...")
         job_count_5030 = 0
+        consecutive_empty = 0
         for row in range(70, 120):  # Check rows 70-120
-            desc_cell = april_ws.cell(row=row, column=1)  # Column A for descriptions
-            if desc_cell.value and str(desc_cell.value).strip():
+            desc_cell_value = cell_value(row, 1)  # Column A for descriptions
+            if desc_cell_value and str(desc_cell_value).strip():
+                consecutive_empty = 0
                 # Check if it looks like a job description
-                desc_value = str(desc_cell.value).strip()
+                desc_value = str(desc_cell_value).strip()
                 if desc_value and not desc_value.lower() in ['job description', 'total', '']:
                     print(f"   Row {row}, Col A: '{desc_value}'")
                     job_count_5030 += 1
             else:
-                # Stop counting when we hit empty rows
-                consecutive_empty = 0
-                for check_row in range(row, row + 3):
-                    check_cell = april_ws.cell(row=check_row, column=1)
-                    if not check_cell.value or not str(check_cell.value).strip():
-                        consecutive_empty += 1
+                # Stop counting after 3 consecutive empty rows
+                consecutive_empty += 1
                 if consecutive_empty >= 3:
                     break
         
@@ -129,6 +158,12 @@ def validate_april_25_tab():
         import traceback
         traceback.print_exc()
         return False
+    
+    finally:
+        # Read-only workbooks keep the file open until closed (a workbook
+        # passed in is left open for the caller)
+        if owns_workbook and workbook is not None:
+            workbook.close()
 
 if __name__ == "__main__":
     validate_april_25_tab() 
\ No newline at end of file
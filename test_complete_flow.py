@@ -6,11 +6,13 @@ This test simulates a user uploading files and processing them through the syste
 
 import sys
 import os
+import argparse
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import tempfile
-import shutil
+from functools import lru_cache
 
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent / "src"))
@@ -19,18 +21,52 @@ from data_processing.aggregation import aggregate_gl_data
 from data_processing.merge_data import process_wip_merge, compute_variances
 from data_processing.column_mapping import map_dataframe_columns
 from data_processing.excel_integration_v2 import (
-    load_wip_workbook, find_or_create_monthly_tab, find_section_markers,
+    load_wip_workbook, find_monthly_tab, find_section_markers,
     create_backup, update_wip_report_v2
 )
 
-def test_complete_workflow():
-    """Test the complete workflow with real client files"""
+# python-calamine (pandas >= 2.2) parses XLSX much faster than openpyxl; fall
+# back to pandas' default engine when it isn't available
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_READ_ENGINE = 'calamine' if tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2) else None
+except ImportError:
+    EXCEL_READ_ENGINE = None
+
+GL_FILE = "test_data/GL Inquiry Export.xlsx"
+WIP_FILE = "test_data/WIP Worksheet Export.xlsx"
+
+@lru_cache(maxsize=None)
+def _load_inputs_cached(gl_mtime, wip_mtime):
+    gl_df = pd.read_excel(GL_FILE, engine=EXCEL_READ_ENGINE)
+    gl_df = map_dataframe_columns(gl_df, 'gl_inquiry')
+    
+    wip_df = pd.read_excel(WIP_FILE, engine=EXCEL_READ_ENGINE)
+    wip_df = map_dataframe_columns(wip_df, 'wip_worksheet')
+    
+    return gl_df, wip_df
+
+def _column_values(df, column):
+    """Return a column as a float array (NaN as 0), or zeros if the column is missing"""
+    if column not in df.columns:
+        return np.zeros(len(df))
+    return df[column].to_numpy(dtype=np.float64, na_value=0.0)
+
+def _load_inputs():
+    """Load and column-map the GL and WIP exports once per file version"""
+    gl_df, wip_df = _load_inputs_cached(os.path.getmtime(GL_FILE), os.path.getmtime(WIP_FILE))
+    
+    # Hand out copies: the pipeline adds and rewrites columns in place
+    return gl_df.copy(), wip_df.copy()
+
+def test_complete_workflow(quick=False):
+    """Test the complete workflow with real client files (quick: skip the Excel integration steps)"""
     print("🧪 Testing Complete WIP Report Automation Workflow")
     print("=" * 60)
     
     # File paths
-    gl_file = "test_data/GL Inquiry Export.xlsx"
-    wip_file = "test_data/WIP Worksheet Export.xlsx" 
+    gl_file = GL_FILE
+    wip_file = WIP_FILE
     master_file = "test_data/Master WIP Report.xlsx"
     
     # Check if files exist
@@ -45,8 +81,7 @@ def test_complete_workflow():
     try:
         # Step 1: Load and process GL data
         print("\n📊 Step 1: Loading GL Inquiry data...")
-        gl_df = pd.read_excel(gl_file)
-        gl_df = map_dataframe_columns(gl_df, 'gl_inquiry')
+        gl_df, wip_df = _load_inputs()
         print(f"   Loaded {len(gl_df)} GL transactions")
         
         # Step 2: Aggregate GL data
@@ -58,20 +93,20 @@ def test_complete_workflow():
         
         # Step 3: Load and process WIP worksheet
         print("\n📋 Step 3: Loading WIP Worksheet data...")
-        wip_df = pd.read_excel(wip_file)
-        wip_df = map_dataframe_columns(wip_df, 'wip_worksheet')
+        # Loaded together with the GL data in step 1
         print(f"   Loaded {len(wip_df)} WIP jobs")
         
         # Step 4: Merge data  
         print("\n🔗 Step 4: Merging WIP and GL data...")
-        # Save WIP file temporarily for processing
-        temp_wip_path = "temp_wip.xlsx"
-        wip_df.to_excel(temp_wip_path, index=False)
-        merged_df = process_wip_merge(temp_wip_path, gl_aggregated, include_closed=False)
-        os.remove(temp_wip_path)  # Clean up
+        # The WIP data is already loaded and mapped, so merge it directly
+        merged_df = process_wip_merge(wip_df, gl_aggregated, include_closed=False)
         print(f"   Merged to {len(merged_df)} total jobs")
         
-        jobs_with_activity = len(merged_df[(merged_df['Sub Labor'] > 0) | (merged_df['Material'] > 0)])
+        # Count straight from the combined mask instead of slicing out rows
+        jobs_with_activity = int(np.count_nonzero(
+            (_column_values(merged_df, 'Sub Labor') > 0) |
+            (_column_values(merged_df, 'Material') > 0)
+        ))
         print(f"   Jobs with activity: {jobs_with_activity}")
         
         # Step 5: Compute variances
@@ -79,29 +114,40 @@ def test_complete_workflow():
         final_df = compute_variances(merged_df)
         
         # Count large variances
-        large_variances = len(final_df[
-            (abs(final_df.get('Sub Labor Variance', 0)) > 1000) |
-            (abs(final_df.get('Material Variance', 0)) > 1000)
-        ])
+        large_variances = int(np.count_nonzero(
+            (np.abs(_column_values(final_df, 'Sub Labor Variance')) > 1000) |
+            (np.abs(_column_values(final_df, 'Material Variance')) > 1000)
+        ))
         print(f"   Large variances (>$1,000): {large_variances}")
         
+        if quick:
+            # Steps 6-8 only load and inspect the master workbook
+            print("\n⏭️  Quick run: skipping Excel integration steps 6-8")
+            return True
+        
         # Step 6: Test Excel integration
         print("\n📋 Step 6: Testing Excel integration...")
         
-        # Create a copy for testing
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
-            temp_path = temp_file.name
-            shutil.copy2(master_file, temp_path)
-        
-        try:
-            # Load workbook
-            wb = load_wip_workbook(temp_path)
-            # Use an existing tab for testing
-            test_month = "May 25"
-            ws = find_or_create_monthly_tab(wb, test_month)
-            
-            # Find sections
-            section_markers = find_section_markers(ws, ["5040", "5030"])
+        # Backups go to a scratch directory that is removed afterwards;
+        # create_backup only reads the master, so it needs no copy of its own
+        with tempfile.TemporaryDirectory() as backup_dir:
+            # Load workbook (read-only: this step only detects sections, so
+            # the master itself can be read)
+            wb = load_wip_workbook(master_file, read_only=True)
+            try:
+                # Use an existing tab for testing (a read-only workbook can't
+                # have tabs added)
+                test_month = "May 25"
+                ws = find_monthly_tab(wb, test_month)
+                if ws is None:
+                    print(f"   ❌ '{test_month}' tab not found in the Master WIP Report")
+                    return False
+                
+                # Find sections
+                section_markers = find_section_markers(ws, ["5040", "5030"])
+            finally:
+                # Read-only workbooks keep the file open until closed
+                wb.close()
             section_5040_row = section_markers.get("5040", (None, None))[0] if section_markers.get("5040") else None
             section_5030_row = section_markers.get("5030", (None, None))[0] if section_markers.get("5030") else None
             
@@ -113,10 +159,9 @@ def test_complete_workflow():
                 
                 # Test backup creation
                 print("\n💾 Step 7: Testing backup creation...")
-                backup_path = create_backup(temp_path)
+                backup_path = create_backup(master_file, backup_dir=backup_dir)
                 if os.path.exists(backup_path):
                     print(f"   ✅ Backup created: {os.path.basename(backup_path)}")
-                    os.remove(backup_path)  # Clean up
                 else:
                     print("   ❌ Backup creation failed")
                     
@@ -146,13 +191,6 @@ def test_complete_workflow():
             else:
                 print("   ❌ Section detection failed")
                 return False
-            
-            wb.close()
-            
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
         
         return True
         
@@ -168,18 +206,21 @@ def test_data_validation():
     print("-" * 40)
     
     try:
-        # Load files
-        gl_df = pd.read_excel("test_data/GL Inquiry Export.xlsx")
-        gl_df = map_dataframe_columns(gl_df, 'gl_inquiry')
-        
-        wip_df = pd.read_excel("test_data/WIP Worksheet Export.xlsx")
-        wip_df = map_dataframe_columns(wip_df, 'wip_worksheet')
+        # Load files (reuses the frames the workflow test already loaded)
+        gl_df, wip_df = _load_inputs()
         
         # Test GL data quality
         print("\n📊 GL Data Quality:")
-        account_5040_count = len(gl_df[gl_df['Account'].str.contains('5040', na=False)])
-        account_5030_count = len(gl_df[gl_df['Account'].str.contains('5030', na=False)])
-        account_4020_count = len(gl_df[gl_df['Account'].str.contains('4020', na=False)])
+        # Count rows per distinct account in one pass, then match the codes
+        # against the (few) distinct accounts only
+        account_counts = gl_df['Account'].dropna().astype(str).value_counts()
+        
+        def count_account_rows(code):
+            return int(account_counts[account_counts.index.str.contains(code, regex=False)].sum())
+        
+        account_5040_count = count_account_rows('5040')
+        account_5030_count = count_account_rows('5030')
+        account_4020_count = count_account_rows('4020')
         
         print(f"   - 5040 (Sub Labor) transactions: {account_5040_count}")
         print(f"   - 5030 (Material) transactions: {account_5030_count}")
@@ -194,12 +235,14 @@ def test_data_validation():
         print(f"   - Closed jobs: {closed_jobs}")
         
         # Test job number matching
-        gl_jobs = set(gl_df['Job Number'].str.strip().unique())
-        wip_jobs = set(wip_df['Job Number'].str.strip().unique())
+        # Index set operations run on pandas' hash tables instead of
+        # building Python sets of every job number
+        gl_jobs = pd.Index(gl_df['Job Number'].str.strip().unique())
+        wip_jobs = pd.Index(wip_df['Job Number'].str.strip().unique())
         
         matching_jobs = gl_jobs.intersection(wip_jobs)
-        gl_only_jobs = gl_jobs - wip_jobs
-        wip_only_jobs = wip_jobs - gl_jobs
+        gl_only_jobs = gl_jobs.difference(wip_jobs)
+        wip_only_jobs = wip_jobs.difference(gl_jobs)
         
         print(f"\n🔗 Job Matching Analysis:")
         print(f"   - Jobs in both GL and WIP: {len(matching_jobs)}")
@@ -216,11 +259,16 @@ def test_data_validation():
         return False
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="WIP Report Automation - Complete System Test")
+    parser.add_argument("--quick", "--no-excel", action="store_true",
+                        help="skip the Excel integration steps (6-8)")
+    args = parser.parse_args()
+    
     print("🚀 WIP Report Automation - Complete System Test")
     print("=" * 60)
     
     # Run main workflow test
-    workflow_success = test_complete_workflow()
+    workflow_success = test_complete_workflow(quick=args.quick)
     
     # Run data validation test
     validation_success = test_data_validation()
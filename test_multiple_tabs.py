@@ -8,24 +8,26 @@ import pandas as pd
 from pathlib import Path
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 # Add src to path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from data_processing.excel_integration_v2 import (
-    load_wip_workbook, 
-    find_section_markers
+    load_wip_workbook,
+    find_section_markers_in_rows
 )
 
-def count_jobs_in_section(worksheet, start_row, column=1, max_rows=50):
+# Words that mark header and total rows rather than jobs (matched anywhere in
+# the lowered cell text, so 'Total 5040' and 'Subtotal:' are skipped too)
+_SKIP_WORDS = ('job#', 'job description', 'total', 'subtotal', 'sum')
+
+def count_jobs_in_values(values):
     """
-    Count jobs in a section starting from given row.
+    Count jobs in a column's values, starting from the first row of a section.
     
     Args:
-        worksheet: The worksheet to scan
-        start_row: Row to start counting from
-        column: Column to check for job data (default: 1 = Column A)
-        max_rows: Maximum rows to scan
+        values: Cell values of the job column, one per row
         
     Returns:
         tuple: (job_count, jobs_list)
@@ -33,15 +35,13 @@ def count_jobs_in_section(worksheet, start_row, column=1, max_rows=50):
     jobs = []
     consecutive_empty = 0
     
-    for row_offset in range(max_rows):
-        row_num = start_row + row_offset
-        cell = worksheet.cell(row=row_num, column=column)
-        
-        if cell.value and str(cell.value).strip():
-            job_value = str(cell.value).strip()
+    for value in values:
+        # Stringify and lower each value once (empty cells come through as None)
+        job_value = str(value).strip() if value else ''
+        if job_value:
             # Skip headers and totals
-            if not any(skip_word in job_value.lower() for skip_word in 
-                      ['job#', 'job description', 'total', 'subtotal', 'sum', '']):
+            lowered = job_value.lower()
+            if not any(word in lowered for word in _SKIP_WORDS):
                 jobs.append(job_value)
                 consecutive_empty = 0
             else:
@@ -55,12 +55,94 @@ def count_jobs_in_section(worksheet, start_row, column=1, max_rows=50):
     
     return len(jobs), jobs
 
-def analyze_worksheet_structure(worksheet, sheet_name):
-    """Analyze the structure of a single worksheet."""
+def count_jobs_in_section(worksheet, start_row, column=1, max_rows=50):
+    """
+    Count jobs in a section starting from given row.
+    
+    Args:
+        worksheet: The worksheet to scan
+        start_row: Row to start counting from
+        column: Column to check for job data (default: 1 = Column A)
+        max_rows: Maximum rows to scan
+        
+    Returns:
+        tuple: (job_count, jobs_list)
+    """
+    # Stream the column's values once instead of fetching each cell
+    values = worksheet.iter_rows(min_row=start_row, max_row=start_row + max_rows - 1,
+                                 min_col=column, max_col=column, values_only=True)
+    
+    return count_jobs_in_values(value for (value,) in values)
+
+def analyze_sheet(worksheet, max_rows=50):
+    """
+    Find the 5040/5030 sections of a worksheet and count the jobs beneath them.
+    
+    The top of the sheet (rows 1-150, columns A-J) is read once and both the
+    marker search and the job counts run over that grid.
+    
+    Args:
+        worksheet: The worksheet to scan
+        max_rows: Maximum rows to scan below each section header
+        
+    Returns:
+        dict: {section: (position, job_list)}, position being (row, col) or None
+    """
+    grid = list(worksheet.iter_rows(min_row=1, max_row=150, max_col=10, values_only=True))
+    markers = find_section_markers_in_rows(grid, ['5040', '5030'])
+    
+    sections = {}
+    for section, position in markers.items():
+        job_list = []
+        if position:
+            # Jobs start on the row after the header (grid index == header row)
+            start_row = position[0]
+            _, job_list = count_jobs_in_values(row[0] if row else None for row in grid[start_row:start_row + max_rows])
+        sections[section] = (position, job_list)
+    
+    return sections
+
+def _analyze_one_sheet(args):
+    """Analyze one tab in a worker process, with its own read-only workbook."""
+    file_path, sheet_name = args
+    workbook = load_wip_workbook(file_path, read_only=True)
+    try:
+        return analyze_sheet(workbook[sheet_name])
+    finally:
+        workbook.close()
+
+def analyze_tabs(file_path, workbook, sheet_names):
+    """
+    Run analyze_sheet over several tabs, in parallel when possible.
+    
+    openpyxl parses in pure Python and holds the GIL, so the tabs are spread
+    over worker processes, each opening the file read-only (which is nearly
+    instant). With a single tab or a single CPU the already loaded workbook is
+    scanned tab by tab instead.
+    
+    Args:
+        file_path: Path to the workbook, opened again by each worker
+        workbook: The already loaded workbook, used when running sequentially
+        sheet_names: Tabs to analyze
+        
+    Returns:
+        list: analyze_sheet results, in the same order as sheet_names
+    """
+    workers = min(len(sheet_names), os.cpu_count() or 1)
+    
+    if workers < 2:
+        return [analyze_sheet(workbook[sheet_name]) for sheet_name in sheet_names]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_analyze_one_sheet, [(str(file_path), sheet_name) for sheet_name in sheet_names]))
+
+def analyze_worksheet_structure(worksheet, sheet_name, sections=None):
+    """Analyze the structure of a single worksheet (or report precomputed analyze_sheet results)."""
     print(f"\n📋 Analyzing {sheet_name}...")
     
-    # Find section markers
-    markers = find_section_markers(worksheet, ['5040', '5030'])
+    # Find section markers and count jobs in a single pass over the sheet
+    if sections is None:
+        sections = analyze_sheet(worksheet)
     
     analysis = {
         'sheet_name': sheet_name,
@@ -69,48 +151,29 @@ def analyze_worksheet_structure(worksheet, sheet_name):
         'sample_jobs': {}
     }
     
-    # Check 5040 section
-    if markers['5040']:
-        start_row, start_col = markers['5040']
-        print(f"   ✅ 5040 section found at row {start_row}, col {start_col}")
-        
-        # Count jobs starting from row after header
-        job_count, job_list = count_jobs_in_section(worksheet, start_row + 1)
-        analysis['sections_found']['5040'] = (start_row, start_col)
-        analysis['job_counts']['5040'] = job_count
-        analysis['sample_jobs']['5040'] = job_list[:3]  # First 3 jobs as sample
-        
-        print(f"      Jobs found: {job_count}")
-        if job_list:
-            print(f"      Sample jobs: {job_list[:3]}")
-    else:
-        print(f"   ❌ 5040 section not found")
-        analysis['sections_found']['5040'] = None
-        analysis['job_counts']['5040'] = 0
-    
-    # Check 5030 section
-    if markers['5030']:
-        start_row, start_col = markers['5030']
-        print(f"   ✅ 5030 section found at row {start_row}, col {start_col}")
-        
-        # Count jobs starting from row after header
-        job_count, job_list = count_jobs_in_section(worksheet, start_row + 1)
-        analysis['sections_found']['5030'] = (start_row, start_col)
-        analysis['job_counts']['5030'] = job_count
-        analysis['sample_jobs']['5030'] = job_list[:3]  # First 3 jobs as sample
-        
-        print(f"      Jobs found: {job_count}")
-        if job_list:
-            print(f"      Sample jobs: {job_list[:3]}")
-    else:
-        print(f"   ❌ 5030 section not found")
-        analysis['sections_found']['5030'] = None
-        analysis['job_counts']['5030'] = 0
+    for section in ['5040', '5030']:
+        position, job_list = sections[section]
+        if position:
+            start_row, start_col = position
+            print(f"   ✅ {section} section found at row {start_row}, col {start_col}")
+            
+            job_count = len(job_list)
+            analysis['sections_found'][section] = (start_row, start_col)
+            analysis['job_counts'][section] = job_count
+            analysis['sample_jobs'][section] = job_list[:3]  # First 3 jobs as sample
+            
+            print(f"      Jobs found: {job_count}")
+            if job_list:
+                print(f"      Sample jobs: {job_list[:3]}")
+        else:
+            print(f"   ❌ {section} section not found")
+            analysis['sections_found'][section] = None
+            analysis['job_counts'][section] = 0
     
     return analysis
 
-def test_multiple_tabs_robustness():
-    """Test section detection across multiple monthly tabs."""
+def test_multiple_tabs_robustness(workbook=None):
+    """Test section detection across multiple monthly tabs. (workbook: an already loaded, read-only Master WIP Report to reuse)"""
     print("🧪 Testing Section Detection Robustness Across Multiple Tabs")
     print("=" * 70)
     
@@ -121,10 +184,14 @@ def test_multiple_tabs_robustness():
         print(f"❌ Master WIP Report not found: {master_report_file}")
         return False
     
+    owns_workbook = workbook is None
     try:
-        # Load workbook
-        workbook = load_wip_workbook(str(master_report_file))
-        print(f"✅ Loaded workbook with {len(workbook.sheetnames)} sheets")
+        # Load workbook (read-only: this script only inspects values)
+        if owns_workbook:
+            workbook = load_wip_workbook(str(master_report_file), read_only=True)
+        # sheetnames rebuilds its list on every access; look tabs up in a set
+        sheet_names = frozenset(workbook.sheetnames)
+        print(f"✅ Loaded workbook with {len(sheet_names)} sheets")
         
         # Target monthly tabs to test (in chronological order)
         target_tabs = [
@@ -134,15 +201,16 @@ def test_multiple_tabs_robustness():
         ]
         
         # Find which tabs actually exist
-        existing_tabs = [tab for tab in target_tabs if tab in workbook.sheetnames]
+        existing_tabs = [tab for tab in target_tabs if tab in sheet_names]
         print(f"📊 Found {len(existing_tabs)} monthly tabs to test: {existing_tabs}")
         
-        # Analyze each tab
+        # Analyze each tab (the tabs are independent, so they are scanned in
+        # parallel and reported in order afterwards)
         results = []
+        tab_sections = analyze_tabs(master_report_file, workbook, existing_tabs)
         
-        for tab_name in existing_tabs:
-            worksheet = workbook[tab_name]
-            analysis = analyze_worksheet_structure(worksheet, tab_name)
+        for tab_name, sections in zip(existing_tabs, tab_sections):
+            analysis = analyze_worksheet_structure(None, tab_name, sections)
             results.append(analysis)
         
         # Summary analysis
@@ -251,6 +319,12 @@ def test_multiple_tabs_robustness():
         import traceback
         traceback.print_exc()
         return False
+    
+    finally:
+        # Read-only workbooks keep the file open until closed (a workbook
+        # passed in is left open for the caller)
+        if owns_workbook and workbook is not None:
+            workbook.close()
 
 if __name__ == "__main__":
     success = test_multiple_tabs_robustness()
@@ -17,13 +17,15 @@ from data_processing.aggregation import process_gl_inquiry
 from data_processing.merge_data import process_wip_merge, get_jobs_for_update
 from data_processing.excel_integration_v2 import (
     load_wip_workbook, 
-    find_or_create_monthly_tab,
     find_section_markers
 )
 from data_processing.column_mapping import map_columns_for_file_type
 
-def test_corrected_real_data():
-    """Test our modules with real client data using CORRECTED account types."""
+# Sample rows are only printed with WIP_VERBOSE=1; formatting wide frames adds up
+VERBOSE = os.environ.get('WIP_VERBOSE', '0') == '1'
+
+def test_corrected_real_data(workbook=None):
+    """Test our modules with real client data using CORRECTED account types. (workbook: an already loaded, read-only Master WIP Report to reuse)"""
     print("🚀 Testing WIP Automation with CORRECTED Real Client Data")
     print("=" * 70)
     
@@ -57,9 +59,10 @@ def test_corrected_real_data():
         print(f"   GL jobs count: {gl_aggregated['Job Number'].nunique()}")
         
         # Show sample with CORRECTED account types
-        print("   Sample GL aggregated data (CORRECTED):")
-        print("   5040 accounts = 'Sub Labor', 5030 accounts = 'Material'")
-        print(gl_aggregated.head(3))
+        if VERBOSE:
+            print("   Sample GL aggregated data (CORRECTED):")
+            print("   5040 accounts = 'Sub Labor', 5030 accounts = 'Material'")
+            print(gl_aggregated.head(3).to_string(index=False))
         print()
         
         # Test 2: Load and examine WIP Worksheet
@@ -73,16 +76,19 @@ def test_corrected_real_data():
         print("🔗 Step 3: Testing WIP merge process...")
         merged_data = process_wip_merge(str(wip_worksheet_file), gl_aggregated)
         print(f"   Merged data shape: {merged_data.shape}")
-        print(f"   Jobs in merged data: {merged_data['Job Number'].nunique()}")
+        # Counted once; the summary reports it again
+        n_unique_jobs = merged_data['Job Number'].nunique()
+        print(f"   Jobs in merged data: {n_unique_jobs}")
         
         # Show column names to verify account types
         print(f"   Merged data columns: {list(merged_data.columns)}")
         
         # Show sample of merged data
-        print("   Sample merged data:")
-        display_cols = ['Job Number', 'Job Name', 'Sub Labor', 'Material', 'Other']
-        available_cols = [col for col in display_cols if col in merged_data.columns]
-        print(merged_data[available_cols].head(3))
+        if VERBOSE:
+            print("   Sample merged data:")
+            display_cols = ['Job Number', 'Job Name', 'Sub Labor', 'Material', 'Other']
+            available_cols = [col for col in display_cols if col in merged_data.columns]
+            print(merged_data[available_cols].head(3).to_string(index=False))
         print()
         
         # Test 4: Get data for each section (CORRECTED)
@@ -91,21 +97,24 @@ def test_corrected_real_data():
         # 5040 section gets Sub Labor data
         section_5040_data = get_jobs_for_update(merged_data, '5040')
         print(f"   5040 section (Sub Labor) data shape: {section_5040_data.shape}")
-        if not section_5040_data.empty:
+        if VERBOSE and not section_5040_data.empty:
             print("   Sample 5040 section data:")
-            print(section_5040_data.head(3))
+            print(section_5040_data.head(3).to_string(index=False))
         
         # 5030 section gets Material data  
         section_5030_data = get_jobs_for_update(merged_data, '5030')
         print(f"   5030 section (Material) data shape: {section_5030_data.shape}")
-        if not section_5030_data.empty:
+        if VERBOSE and not section_5030_data.empty:
             print("   Sample 5030 section data:")
-            print(section_5030_data.head(3))
+            print(section_5030_data.head(3).to_string(index=False))
         print()
         
         # Test 5: Load Master WIP Report
         print("📈 Step 5: Testing Master WIP Report reading with enhanced section finding...")
-        workbook = load_wip_workbook(str(master_report_file))
+        # Read-only: this check only inspects values and never saves
+        owns_workbook = workbook is None
+        if owns_workbook:
+            workbook = load_wip_workbook(str(master_report_file), read_only=True)
         print(f"   Workbook loaded successfully")
         print(f"   Sheet names: {workbook.sheetnames}")
         
@@ -114,33 +123,47 @@ def test_corrected_real_data():
         current_month = datetime.now().strftime("%b %y")
         print(f"   Looking for monthly tab: {current_month}")
         
-        monthly_ws = find_or_create_monthly_tab(workbook, current_month)
-        print(f"   Monthly worksheet: {monthly_ws.title}")
+        # A read-only workbook can't get a new tab; the existing tabs are
+        # tried below when this month's doesn't exist yet
+        if current_month in workbook.sheetnames:
+            monthly_ws = workbook[current_month]
+            print(f"   Monthly worksheet: {monthly_ws.title}")
+        else:
+            monthly_ws = None
+            print(f"   No tab for {current_month} yet")
         
         # Test finding section markers with enhanced patterns
         print("   Testing enhanced section marker detection...")
-        markers = find_section_markers(monthly_ws, ['5040', '5030'])
+        if monthly_ws is not None:
+            markers = find_section_markers(monthly_ws, ['5040', '5030'])
+        else:
+            markers = {'5040': None, '5030': None}
         print(f"   Section markers found: {markers}")
         
-        # If no sections found in new tab, try an existing tab
+        # If no sections found in new tab, try the existing tabs in order
+        # (read-only sheets are parsed only when scanned, so stopping at the
+        # first tab with sections leaves the rest untouched)
         if not any(markers.values()):
             print("   No sections in new tab, trying existing tab with data...")
-            for sheet_name in ['Nov 24', 'Dec 24', 'Jan 25', 'Feb 25', 'Mar 25', 'Apr 25', 'May 25']:
-                if sheet_name in workbook.sheetnames:
-                    test_ws = workbook[sheet_name]
-                    test_markers = find_section_markers(test_ws, ['5040', '5030'])
-                    if any(test_markers.values()):
-                        print(f"   Found sections in {sheet_name}: {test_markers}")
-                        break
+            for sheet_name in workbook.sheetnames:
+                if sheet_name == current_month:
+                    continue
+                test_markers = find_section_markers(workbook[sheet_name], ['5040', '5030'])
+                if any(test_markers.values()):
+                    print(f"   Found sections in {sheet_name}: {test_markers}")
+                    break
+        
+        if owns_workbook:
+            workbook.close()
         
         print()
         print("🎉 SUCCESS: All corrected real data tests passed!")
         print("✨ Ready for Streamlit interface with CORRECT account mapping!")
         print()
         print("📋 SUMMARY:")
-        print(f"   • 5040 Section: Sub Labor costs (found {len(section_5040_data[section_5040_data['Sub Labor'] != 0])} jobs with amounts)")
-        print(f"   • 5030 Section: Material costs (found {len(section_5030_data[section_5030_data['Material'] != 0])} jobs with amounts)")
-        print(f"   • Total jobs processed: {merged_data['Job Number'].nunique()}")
+        print(f"   • 5040 Section: Sub Labor costs (found {int((section_5040_data['Sub Labor'].to_numpy() != 0).sum())} jobs with amounts)")
+        print(f"   • 5030 Section: Material costs (found {int((section_5030_data['Material'].to_numpy() != 0).sum())} jobs with amounts)")
+        print(f"   • Total jobs processed: {n_unique_jobs}")
         
         return True
         
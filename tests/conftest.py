@@ -0,0 +1,62 @@
+"""
+Shared pytest configuration.
+
+Puts src/ and the repository root on sys.path once per session, so the
+standalone check scripts at the repository root (which import
+``data_processing`` directly) can be imported by the tests, and shares the
+Master WIP Report workbook and the synthetic merge data between the tests
+that read them. Tests that parse Excel files are marked ``slow``;
+``pytest -m "not slow"`` skips them.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_processing.excel_integration import load_wip_workbook
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+for path in (REPO_ROOT, REPO_ROOT / 'src'):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: test parses Excel files")
+
+
+@pytest.fixture(scope="session")
+def master_workbook():
+    """Read-only Master WIP Report from test_data/, loaded once per session."""
+    path = REPO_ROOT / 'test_data' / 'Master WIP Report.xlsx'
+    if not path.exists():
+        pytest.skip("Master WIP Report not in test_data/")
+    
+    workbook = load_wip_workbook(str(path), read_only=True)
+    yield workbook
+    workbook.close()
+
+
+@pytest.fixture(scope="module", params=[100, 100_000], ids=['100_jobs', '100k_jobs'])
+def scale_data(request):
+    """Create synthetic WIP data and GL data for every other job, at a small and a large size."""
+    n = request.param
+    rng = np.random.default_rng(0)
+    job_numbers = [f'J{i:08d}' for i in range(n)]
+    wip_data = pd.DataFrame({
+        'Job Number': job_numbers,
+        'Status': np.where(np.arange(n) % 5 == 0, 'Closed', 'Active'),
+        'Job Name': 'x',
+        'Budget Material': rng.random(n) * 1e4,
+        'Budget Labor': rng.random(n) * 1e4
+    })
+    gl_data = pd.DataFrame({
+        'Job Number': job_numbers[::2],
+        'Material': rng.random(len(job_numbers[::2])) * 1e4,
+        'Sub Labor': rng.random(len(job_numbers[::2])) * 1e4
+    })
+    return wip_data, gl_data
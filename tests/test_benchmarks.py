@@ -0,0 +1,35 @@
+"""
+Benchmarks for the WIP merge pipeline
+
+These run only when pytest-benchmark is installed. To gate a change on merge
+performance, save a baseline on the main branch and compare against it:
+
+    pytest tests/test_benchmarks.py --benchmark-autosave
+    pytest tests/test_benchmarks.py --benchmark-compare --benchmark-compare-fail=mean:50%
+
+The second run fails if the mean time of a benchmark grew by more than 50%.
+"""
+
+import pytest
+
+from src.data_processing.merge_data import merge_wip_with_gl, process_wip_merge
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_process_wip_merge_benchmark(benchmark, scale_data):
+    """Benchmark the merge pipeline on synthetic WIP and GL data."""
+    wip_data, gl_data = scale_data
+    
+    result_df = benchmark(process_wip_merge, wip_data, gl_data, include_closed=False)
+    
+    assert len(result_df) == (wip_data['Status'] != 'Closed').sum()
+
+
+def test_merge_wip_with_gl_benchmark(benchmark, scale_data):
+    """Benchmark the WIP/GL join on its own."""
+    wip_data, gl_data = scale_data
+    
+    result_df = benchmark(merge_wip_with_gl, wip_data, gl_data)
+    
+    assert len(result_df) == len(wip_data)
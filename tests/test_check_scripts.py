@@ -0,0 +1,66 @@
+"""
+Test cases for the workbook check scripts
+
+This module runs the standalone check scripts at the repository root under
+pytest. They read the client workbooks from test_data/, so the tests are
+skipped when those files aren't present.
+"""
+
+import pytest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TEST_DATA = REPO_ROOT / 'test_data'
+
+MASTER_FILE = TEST_DATA / 'Master WIP Report.xlsx'
+EXPORT_FILES = [TEST_DATA / 'GL Inquiry Export.xlsx', TEST_DATA / 'WIP Worksheet Export.xlsx']
+
+requires_master = pytest.mark.skipif(not MASTER_FILE.exists(), reason="Master WIP Report not in test_data/")
+requires_exports = pytest.mark.skipif(not all(path.exists() for path in EXPORT_FILES),
+                                      reason="GL/WIP exports not in test_data/")
+
+
+@pytest.fixture
+def in_repo_root(monkeypatch):
+    """The scripts open test_data/ relative to the working directory."""
+    monkeypatch.chdir(REPO_ROOT)
+
+
+@requires_master
+@requires_exports
+def test_complete_flow(in_repo_root):
+    """Test the end-to-end workflow script."""
+    import test_complete_flow as script
+    
+    assert script.test_complete_workflow()
+    assert script.test_data_validation()
+
+
+@requires_exports
+def test_real_data(in_repo_root, master_workbook):
+    """Test the real-data check script."""
+    import test_real_data as script
+    
+    assert script.test_real_data(master_workbook)
+
+
+@requires_exports
+def test_corrected_real_data(in_repo_root, master_workbook):
+    """Test the corrected real-data check script."""
+    import test_real_data_v2 as script
+    
+    assert script.test_corrected_real_data(master_workbook)
+
+
+def test_multiple_tabs(in_repo_root, master_workbook):
+    """Test the multi-tab section detection script."""
+    import test_multiple_tabs as script
+    
+    assert script.test_multiple_tabs_robustness(master_workbook)
+
+
+def test_april_25_validation(in_repo_root, master_workbook):
+    """Test the April 25 tab validation script."""
+    import test_april_25_validation as script
+    
+    assert script.validate_april_25_tab(master_workbook)
@@ -6,6 +6,7 @@ This module contains pytest test cases to validate the column mapping functional
 
 import pytest
 import pandas as pd
+from src.data_processing import column_mapping
 from src.data_processing.column_mapping import (
     COLUMN_MAPPINGS,
     get_similarity_score,
@@ -40,6 +41,24 @@ class TestGetSimilarityScore:
         """Test similarity score for completely different strings."""
         score = get_similarity_score("Job Number", "Description")
         assert score < 0.3
+    
+    def test_fallback_matches_rapidfuzz(self, monkeypatch):
+        """Test that the pure Python score equals rapidfuzz's on the known header variations."""
+        fuzz = pytest.importorskip('rapidfuzz.fuzz')
+        monkeypatch.setattr(column_mapping, 'RAPIDFUZZ_AVAILABLE', False)
+        
+        for mappings in COLUMN_MAPPINGS.values():
+            variations = [variation for names in mappings.values() for variation in names]
+            for standard_name in mappings:
+                for variation in variations:
+                    expected = fuzz.ratio(standard_name.lower(), variation.lower()) / 100.0
+                    assert get_similarity_score(standard_name, variation) == pytest.approx(expected)
+    
+    def test_fallback_empty_strings(self, monkeypatch):
+        """Test the pure Python score on empty strings."""
+        monkeypatch.setattr(column_mapping, 'RAPIDFUZZ_AVAILABLE', False)
+        assert get_similarity_score("", "") == 1.0
+        assert get_similarity_score("Job", "") == 0.0
 
 
 class TestFindBestColumnMatch:
@@ -74,6 +93,25 @@ class TestFindBestColumnMatch:
         # With high threshold, should not find match
         match_high = find_best_column_match('Job Number', available_columns, threshold=0.8)
         assert match_high is None
+    
+    def test_fallback_picks_same_matches_as_rapidfuzz(self, monkeypatch):
+        """Test that matching with and without rapidfuzz picks the same columns."""
+        pytest.importorskip('rapidfuzz')
+        
+        def best_matches():
+            # Match each standard name against every other listed variation,
+            # so the fuzzy scores (not an exact hit) decide
+            matches = {}
+            for file_type, mappings in COLUMN_MAPPINGS.items():
+                variations = [variation for names in mappings.values() for variation in names]
+                for standard_name in mappings:
+                    candidates = [variation for variation in variations if variation != standard_name]
+                    matches[file_type, standard_name] = find_best_column_match(standard_name, candidates)
+            return matches
+        
+        with_rapidfuzz = best_matches()
+        monkeypatch.setattr(column_mapping, 'RAPIDFUZZ_AVAILABLE', False)
+        assert best_matches() == with_rapidfuzz
 
 
 class TestMapColumnsForFileType:
@@ -131,6 +169,22 @@ class TestMapColumnsForFileType:
         mapping_strict = map_columns_for_file_type('wip_worksheet', available_columns, strict_mode=True)
         assert 'JobNum' not in mapping_strict
     
+    def test_exact_matches_ignore_case_and_prefer_listed_order(self):
+        """Test exact matching through the lower-cased variation index."""
+        available_columns = ['JOB NO', 'job number', 'status']
+        mapping = map_columns_for_file_type(available_columns, 'wip_worksheet', strict_mode=True)
+
+        # 'Job Number' is listed before 'Job No', so it wins
+        assert mapping == {'job number': 'Job Number', 'status': 'Status'}
+
+    def test_fuzzy_matching_skips_exact_matched_columns(self):
+        """Test that fuzzy matching can't take a column that matched exactly."""
+        available_columns = ['Job Number', 'Status', 'Budget Material', 'Budget Labor']
+        mapping = map_columns_for_file_type(available_columns, 'wip_worksheet')
+
+        # 'Job Name' and 'Actual Material' are close to these but must not claim them
+        assert mapping == {col: col for col in available_columns}
+
     def test_unknown_file_type(self):
         """Test error handling for unknown file type."""
         with pytest.raises(ValueError, match="Unknown file type"):
@@ -146,6 +200,16 @@ class TestMapColumnsForFileType:
             'Job Number': 'Job Number'
         }
         assert mapping == expected_mapping
+    
+    def test_repeated_mapping_returns_fresh_dict(self):
+        """Test that cached mappings can't be changed through a returned dict."""
+        available_columns = ['GL Account', 'Job No', 'DR', 'CR']
+        first = map_columns_for_file_type(available_columns, 'gl_inquiry')
+        first['GL Account'] = 'Changed'
+        second = map_columns_for_file_type(available_columns, 'gl_inquiry')
+        
+        assert second['GL Account'] == 'Account'
+        assert second is not first
 
 
 class TestValidateRequiredColumns:
@@ -217,6 +281,14 @@ class TestSuggestColumnMappings:
         assert 'Status' in suggestions
         assert 'Job Status' in suggestions['Status']
     
+    def test_suggest_mappings_reordered_words(self):
+        """Test that a column with the same words in another order is the top suggestion."""
+        available_columns = ['Labor Budget', 'Mat Budget', 'Material Budget']
+        suggestions = suggest_column_mappings('wip_worksheet', available_columns)
+        
+        assert suggestions['Budget Material'][0] == 'Material Budget'
+        assert suggestions['Budget Labor'][0] == 'Labor Budget'
+    
     def test_suggest_mappings_unknown_file_type(self):
         """Test suggestions for unknown file type."""
         suggestions = suggest_column_mappings('unknown_type', ['Column1'])
@@ -293,6 +365,7 @@ class TestApplyColumnMapping:
         # Should return copy of original DataFrame
         assert list(result_df.columns) == list(df.columns)
         assert result_df.equals(df)
+        assert result_df is not df
 
 
 class TestGetUnmappedColumns:
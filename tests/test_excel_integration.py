@@ -25,8 +25,7 @@ from src.data_processing.excel_integration import (
 )
 
 
-@pytest.fixture
-def sample_workbook():
+def _build_sample_workbook():
     """Create a sample workbook for testing."""
     wb = Workbook()
     ws = wb.active
@@ -53,15 +52,30 @@ def sample_workbook():
     return wb
 
 
+@pytest.fixture(scope="module")
+def sample_workbook():
+    """Sample workbook shared by the tests that only read it (built once per module)."""
+    return _build_sample_workbook()
+
+
 @pytest.fixture
+def writable_workbook():
+    """Sample workbook of its own, for tests that modify it."""
+    return _build_sample_workbook()
+
+
+@pytest.fixture(scope="module")
 def sample_excel_file(sample_workbook):
-    """Create a temporary Excel file for testing."""
+    """Create a temporary Excel file for testing (written once per module)."""
     with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp_file:
         sample_workbook.save(tmp_file.name)
-        yield tmp_file.name
+    yield tmp_file.name
     
     # Cleanup
-    os.unlink(tmp_file.name)
+    try:
+        os.unlink(tmp_file.name)
+    except OSError:
+        pass
 
 
 class TestLoadWIPWorkbook:
@@ -85,6 +99,19 @@ class TestLoadWIPWorkbook:
         # This test mainly ensures the parameter is passed correctly
         workbook = load_wip_workbook(sample_excel_file, keep_vba=False)
         assert workbook is not None
+    
+    def test_load_workbook_read_only(self, sample_excel_file):
+        """Test that read-only workbooks support the value readers."""
+        workbook = load_wip_workbook(sample_excel_file, read_only=True)
+        try:
+            worksheet = workbook["Jan 24"]
+            
+            assert find_section_markers(worksheet, ['5040', '5030']) == {'5040': (3, 1), '5030': (8, 1)}
+            df = get_existing_data_from_section(worksheet, '5040')
+            assert df['Job Number'].tolist()[:2] == ['JOB001', 'JOB002']
+            assert df['Current Value'].tolist()[:2] == [10000, 5000]
+        finally:
+            workbook.close()
 
 
 class TestFindOrCreateMonthlyTab:
@@ -97,13 +124,13 @@ class TestFindOrCreateMonthlyTab:
         assert worksheet is not None
         assert worksheet.title == "Jan 24"
     
-    def test_create_new_tab(self, sample_workbook):
+    def test_create_new_tab(self, writable_workbook):
         """Test creating a new monthly tab."""
-        worksheet = find_or_create_monthly_tab(sample_workbook, "Feb 24")
+        worksheet = find_or_create_monthly_tab(writable_workbook, "Feb 24")
         
         assert worksheet is not None
         assert worksheet.title == "Feb 24"
-        assert "Feb 24" in sample_workbook.sheetnames
+        assert "Feb 24" in writable_workbook.sheetnames
     
     def test_create_tab_with_template(self):
         """Test creating a new tab when template exists."""
@@ -146,6 +173,27 @@ class TestFindSectionMarkers:
         
         assert markers['5040'] == (3, 1)
         assert markers['9999'] is None
+    
+    def test_find_markers_cached_for_read_only(self, sample_excel_file, monkeypatch):
+        """Test that a read-only worksheet is only scanned once per marker."""
+        from src.data_processing import excel_integration
+        
+        scans = []
+        original_scan = excel_integration._scan_section_markers
+        monkeypatch.setattr(excel_integration, '_scan_section_markers',
+                            lambda worksheet, markers: scans.append(list(markers)) or original_scan(worksheet, markers))
+        
+        workbook = load_wip_workbook(sample_excel_file, read_only=True)
+        try:
+            worksheet = workbook["Jan 24"]
+            first = find_section_markers(worksheet, ['5040', '5030'])
+            second = find_section_markers(worksheet, ['5030', '9999'])
+        finally:
+            workbook.close()
+        
+        assert first == {'5040': (3, 1), '5030': (8, 1)}
+        assert second == {'5030': (8, 1), '9999': None}
+        assert scans == [['5040', '5030'], ['9999']]
 
 
 class TestDetectDataRegion:
@@ -185,6 +233,18 @@ class TestDetectDataRegion:
         # Should detect up to row 4 despite the gap
         assert end_row >= 2  # At least to row 2
 
+    def test_detect_data_region_does_not_grow_sheet(self):
+        """Test that scanning past the data doesn't create empty cells."""
+        wb = Workbook()
+        ws = wb.active
+        ws['A1'] = "Data1"
+        ws['B2'] = "Data2"
+        
+        end_row, end_col = detect_data_region(ws, 1, 1)
+        
+        assert (end_row, end_col) == (2, 2)
+        assert (ws.max_row, ws.max_column) == (2, 2)
+
 
 class TestIsFormulaCell:
     """Test cases for is_formula_cell function."""
@@ -393,6 +453,17 @@ class TestGetExistingDataFromSection:
         df = get_existing_data_from_section(ws, '5040')
         
         assert len(df) == 0
+        assert list(df.columns) == ['Job Number', 'Current Value']
+
+    def test_get_existing_data_as_polars(self, sample_workbook):
+        """Test extraction into a polars DataFrame."""
+        pl = pytest.importorskip('polars')
+        worksheet = sample_workbook.active
+        df = get_existing_data_from_section(worksheet, '5040', as_polars=True)
+        
+        assert isinstance(df, pl.DataFrame)
+        assert df.columns == ['Job Number', 'Current Value']
+        assert df['Job Number'].to_list() == get_existing_data_from_section(worksheet, '5040')['Job Number'].tolist()
 
 
 if __name__ == "__main__":
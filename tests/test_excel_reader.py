@@ -0,0 +1,123 @@
+"""
+Test cases for Excel Reader Module
+
+This module contains pytest test cases to validate the streaming Excel reader.
+"""
+
+import pytest
+import pandas as pd
+import tempfile
+import os
+import io
+from openpyxl import Workbook
+
+from src.data_processing.excel_reader import read_excel_values, read_excel_values_many
+
+
+@pytest.fixture
+def sample_gl_data():
+    """Create sample GL data for testing."""
+    return pd.DataFrame({
+        'Account': ['5040-001', '5030-002', '4020-003'],
+        'Job Number': ['JOB001', 'JOB002', 'JOB001'],
+        'Debit': [1000.00, 500.00, 0.00],
+        'Credit': [0.00, 0.00, 300.00]
+    })
+
+
+@pytest.fixture
+def sample_excel_file(sample_gl_data):
+    """Create a temporary Excel file for testing."""
+    with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp_file:
+        sample_gl_data.to_excel(tmp_file.name, index=False)
+        yield tmp_file.name
+    
+    # Cleanup
+    os.unlink(tmp_file.name)
+
+
+class TestReadExcelValues:
+    """Test cases for read_excel_values function."""
+    
+    def test_read_matches_pandas(self, sample_excel_file):
+        """Test that the result matches pd.read_excel."""
+        result_df = read_excel_values(sample_excel_file)
+        expected_df = pd.read_excel(sample_excel_file)
+        
+        pd.testing.assert_frame_equal(result_df, expected_df)
+    
+    def test_read_from_bytes(self, sample_excel_file, sample_gl_data):
+        """Test reading from raw file bytes."""
+        with open(sample_excel_file, 'rb') as f:
+            result_df = read_excel_values(f.read())
+        
+        assert list(result_df.columns) == list(sample_gl_data.columns)
+        assert len(result_df) == len(sample_gl_data)
+    
+    def test_read_named_sheet(self):
+        """Test reading a specific worksheet."""
+        wb = Workbook()
+        wb.active.append(['Ignored'])
+        ws = wb.create_sheet('Data')
+        ws.append(['Job Number', 'Status'])
+        ws.append(['JOB001', 'Active'])
+        buffer = io.BytesIO()
+        wb.save(buffer)
+        
+        result_df = read_excel_values(buffer.getvalue(), sheet_name='Data')
+        
+        assert list(result_df.columns) == ['Job Number', 'Status']
+        assert result_df.iloc[0]['Job Number'] == 'JOB001'
+    
+    def test_read_blank_and_duplicate_headers(self):
+        """Test that blank and repeated headers are named like pd.read_excel names them."""
+        wb = Workbook()
+        wb.active.append(['Job Number', None, 'Amount', 'Amount'])
+        wb.active.append(['JOB001', 'note', 100, 200])
+        buffer = io.BytesIO()
+        wb.save(buffer)
+        
+        result_df = read_excel_values(buffer.getvalue())
+        
+        assert list(result_df.columns) == ['Job Number', 'Unnamed: 1', 'Amount', 'Amount.1']
+        assert list(result_df.columns) == list(pd.read_excel(io.BytesIO(buffer.getvalue())).columns)
+    
+    def test_read_empty_sheet(self):
+        """Test reading a worksheet with no rows."""
+        buffer = io.BytesIO()
+        Workbook().save(buffer)
+        
+        result_df = read_excel_values(buffer.getvalue())
+        
+        assert result_df.empty
+    
+    def test_read_file_not_found(self):
+        """Test error handling when file doesn't exist."""
+        with pytest.raises(FileNotFoundError):
+            read_excel_values('nonexistent_file.xlsx')
+
+
+class TestReadExcelValuesMany:
+    """Test cases for read_excel_values_many function."""
+    
+    def test_read_many_in_order(self, sample_excel_file):
+        """Test that results come back in source order."""
+        buffer = io.BytesIO()
+        pd.DataFrame({'Job Number': ['JOB009'], 'Status': ['Closed']}).to_excel(buffer, index=False)
+        
+        gl_df, wip_df = read_excel_values_many([sample_excel_file, buffer.getvalue()])
+        
+        pd.testing.assert_frame_equal(gl_df, read_excel_values(sample_excel_file))
+        assert list(wip_df.columns) == ['Job Number', 'Status']
+    
+    def test_read_many_same_file(self, sample_excel_file):
+        """Test that reading the same source twice gives equal frames."""
+        results = read_excel_values_many([sample_excel_file, sample_excel_file])
+        
+        assert len(results) == 2
+        pd.testing.assert_frame_equal(results[0], results[1])
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__])
@@ -0,0 +1,83 @@
+"""
+Integration tests for the GL -> WIP -> Master WIP Report pipeline
+
+This module runs the pipeline that test_real_data.py and test_real_data_v2.py
+walk through on the client exports in test_data/. The GL aggregation and the
+WIP merge run once per session and are shared by every test, and the section
+checks run against both excel_integration modules. The tests are skipped
+when the exports aren't present.
+"""
+
+import pytest
+from pathlib import Path
+
+from src.data_processing import excel_integration, excel_integration_v2
+from src.data_processing.aggregation import process_gl_inquiry
+from src.data_processing.merge_data import process_wip_merge, get_jobs_for_update
+
+TEST_DATA = Path(__file__).resolve().parent.parent / 'test_data'
+
+pytestmark = pytest.mark.slow
+
+GL_FILE = TEST_DATA / 'GL Inquiry Export.xlsx'
+WIP_FILE = TEST_DATA / 'WIP Worksheet Export.xlsx'
+
+
+@pytest.fixture(scope="session")
+def gl_aggregated():
+    """GL Inquiry export aggregated by job, computed once per session."""
+    if not GL_FILE.exists():
+        pytest.skip("GL Inquiry export not in test_data/")
+    return process_gl_inquiry(str(GL_FILE))
+
+
+@pytest.fixture(scope="session")
+def merged_data(gl_aggregated):
+    """WIP Worksheet export merged with the aggregated GL data."""
+    if not WIP_FILE.exists():
+        pytest.skip("WIP Worksheet export not in test_data/")
+    return process_wip_merge(str(WIP_FILE), gl_aggregated)
+
+
+def test_gl_aggregated_has_account_type_columns(gl_aggregated):
+    """Test that the aggregated GL data has one column per account type."""
+    for column in ['Job Number', 'Material', 'Sub Labor', 'Other', 'Amount Billed']:
+        assert column in gl_aggregated.columns
+    assert gl_aggregated['Job Number'].is_unique
+
+
+def test_merged_data_carries_gl_amounts(gl_aggregated, merged_data):
+    """Test that merged jobs carry their GL amounts (0 when they had no GL activity)."""
+    amount_columns = ['Material', 'Sub Labor', 'Other']
+    assert len(merged_data) > 0
+    assert not merged_data[amount_columns].isna().any().any()
+
+    gl_by_job = gl_aggregated.set_index('Job Number')[amount_columns]
+    merged_by_job = merged_data.set_index('Job Number')[amount_columns]
+    shared_jobs = merged_by_job.index.intersection(gl_by_job.index)
+    assert (merged_by_job.loc[shared_jobs] == gl_by_job.loc[shared_jobs]).all().all()
+
+
+@pytest.mark.parametrize("section, amount_column", [('5040', 'Sub Labor'), ('5030', 'Material')])
+def test_section_data_split(merged_data, section, amount_column):
+    """Test that each section gets its own account type's amounts."""
+    section_data = get_jobs_for_update(merged_data, section)
+
+    assert amount_column in section_data.columns
+    assert len(section_data) <= len(merged_data)
+
+
+@pytest.mark.parametrize("integration_module", [excel_integration, excel_integration_v2],
+                         ids=['v1', 'v2'])
+def test_find_section_markers_in_master(integration_module, master_workbook):
+    """Test that the section markers are found on at least one tab of the Master WIP Report."""
+    found = {}
+    for sheet_name in master_workbook.sheetnames:
+        markers = integration_module.find_section_markers(master_workbook[sheet_name], ['5040', '5030'])
+        if all(markers.values()):
+            found[sheet_name] = markers
+
+    assert found, "No tab with both the 5040 and 5030 sections"
+    for markers in found.values():
+        # 5030 (Material) sits below 5040 (Sub Labor)
+        assert markers['5030'][0] > markers['5040'][0]
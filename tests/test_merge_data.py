@@ -4,13 +4,16 @@ Test cases for Data Merging Module
 This module contains pytest test cases to validate the WIP worksheet merging functionality.
 """
 
+import io
 import pytest
 import pandas as pd
 import numpy as np
-import tempfile
-import os
+from numpy.testing import assert_allclose
 from src.data_processing.merge_data import (
+    JOB_NUMBER_DTYPE,
     load_wip_worksheet,
+    standardize_wip_columns,
+    normalize_job_numbers,
     trim_job_numbers,
     filter_closed_jobs,
     merge_wip_with_gl,
@@ -20,9 +23,22 @@ from src.data_processing.merge_data import (
 )
 
 
-@pytest.fixture
+def _excel_buffer(df):
+    """Write a DataFrame to an in-memory xlsx file, rewound for reading."""
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False, engine='openpyxl')
+    buffer.seek(0)
+    return buffer
+
+
+def job_set(df):
+    """Return the Job Numbers in a DataFrame as a set, for membership checks."""
+    return set(df['Job Number'])
+
+
+@pytest.fixture(scope="module")
 def sample_wip_data():
-    """Create sample WIP worksheet data for testing."""
+    """Create sample WIP worksheet data for testing (shared, so tests must not modify it)."""
     return pd.DataFrame({
         'Job Number': ['  JOB001  ', 'JOB002', 'JOB003', 'JOB004'],
         'Status': ['Active', 'Closed', 'Active', 'CLOSED'],
@@ -32,9 +48,9 @@ def sample_wip_data():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_gl_data():
-    """Create sample GL aggregated data for testing."""
+    """Create sample GL aggregated data for testing (shared, so tests must not modify it)."""
     return pd.DataFrame({
         'Job Number': ['JOB001', 'JOB002', 'JOB005'],
         'Material': [9500.00, 5200.00, 1000.00],
@@ -43,9 +59,9 @@ def sample_gl_data():
     })
 
 
-@pytest.fixture
-def sample_wip_excel_file():
-    """Create a temporary WIP worksheet Excel file for testing."""
+@pytest.fixture(scope="module")
+def sample_wip_excel_bytes():
+    """Serialize the sample WIP worksheet Excel file once per module."""
     data = {
         'Job Number': ['JOB001', 'JOB002', 'JOB003'],
         'Status': ['Active', 'Closed', 'Active'],
@@ -53,20 +69,34 @@ def sample_wip_excel_file():
         'Budget Material': [10000.00, 5000.00, 7500.00],
         'Budget Labor': [8000.00, 4000.00, 6000.00]
     }
-    df = pd.DataFrame(data)
-    
-    # Create temporary file
-    with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp_file:
-        df.to_excel(tmp_file.name, index=False)
-        yield tmp_file.name
-    
-    # Cleanup
-    os.unlink(tmp_file.name)
+    return _excel_buffer(pd.DataFrame(data)).getvalue()
+
+
+@pytest.fixture
+def sample_wip_excel_file(sample_wip_excel_bytes):
+    """Create an in-memory WIP worksheet Excel file for testing."""
+    return io.BytesIO(sample_wip_excel_bytes)
+
+
+@pytest.fixture(scope="module")
+def section_data():
+    """Create merged data with the columns of both sections (shared, so tests must not modify it)."""
+    return pd.DataFrame({
+        'Job Number': ['JOB001', 'JOB002'],
+        'Job Name': ['Alpha', 'Beta'],
+        'Material': [9500.00, 5200.00],
+        'Labor': [8200.00, 3800.00],
+        'Budget Material': [10000.00, 5000.00],
+        'Budget Labor': [8000.00, 4000.00],
+        'Material Variance': [-500.00, 200.00],
+        'Labor Variance': [200.00, -200.00]
+    })
 
 
 class TestLoadWIPWorksheet:
     """Test cases for load_wip_worksheet function."""
     
+    @pytest.mark.slow
     def test_load_wip_worksheet_success(self, sample_wip_excel_file):
         """Test successful loading of WIP Worksheet file."""
         df = load_wip_worksheet(sample_wip_excel_file)
@@ -76,51 +106,58 @@ class TestLoadWIPWorksheet:
         assert 'Job Number' in df.columns
         assert 'Status' in df.columns
         assert 'Job Name' in df.columns
+
+
+class TestStandardizeWIPColumns:
+    """Test cases for standardize_wip_columns function."""
     
-    def test_load_wip_worksheet_column_variations(self):
-        """Test loading with different column name variations."""
-        data = {
+    def test_standardize_wip_columns_variations(self):
+        """Test standardizing different column name variations."""
+        data = pd.DataFrame({
             'Job No': ['JOB001', 'JOB002'],
             'Job Status': ['Active', 'Closed'],
             'Project Name': ['Alpha', 'Beta'],
             'Mat Budget': [10000.00, 5000.00],
             'Lab Budget': [8000.00, 4000.00]
-        }
-        df = pd.DataFrame(data)
-        
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp_file:
-            df.to_excel(tmp_file.name, index=False)
-            
-            try:
-                result_df = load_wip_worksheet(tmp_file.name)
-                
-                # Check that columns were renamed correctly
-                assert 'Job Number' in result_df.columns
-                assert 'Status' in result_df.columns
-                assert 'Job Name' in result_df.columns
-                assert 'Budget Material' in result_df.columns
-                assert 'Budget Labor' in result_df.columns
-                
-            finally:
-                os.unlink(tmp_file.name)
+        })
+        result_df = standardize_wip_columns(data)
+        
+        # Check that columns were renamed correctly
+        assert 'Job Number' in result_df.columns
+        assert 'Status' in result_df.columns
+        assert 'Job Name' in result_df.columns
+        assert 'Budget Material' in result_df.columns
+        assert 'Budget Labor' in result_df.columns
     
-    def test_load_wip_worksheet_missing_required_columns(self):
+    def test_standardize_wip_columns_missing_required_columns(self):
         """Test error handling when required columns are missing."""
-        data = {
+        data = pd.DataFrame({
             'Job Number': ['JOB001', 'JOB002'],
             'Job Name': ['Alpha', 'Beta']
             # Missing Status column
-        }
-        df = pd.DataFrame(data)
+        })
+        with pytest.raises(ValueError, match="Required column"):
+            standardize_wip_columns(data)
+
+
+class TestNormalizeJobNumbers:
+    """Test cases for normalize_job_numbers function."""
+    
+    def test_normalize_job_numbers_mixed_types(self):
+        """Test that numeric and padded job numbers become trimmed strings."""
+        result = normalize_job_numbers(pd.Series(['  JOB001  ', 1234, 'JOB002']))
         
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp_file:
-            df.to_excel(tmp_file.name, index=False)
-            
-            try:
-                with pytest.raises(ValueError, match="Required column"):
-                    load_wip_worksheet(tmp_file.name)
-            finally:
-                os.unlink(tmp_file.name)
+        assert result.tolist() == ['JOB001', '1234', 'JOB002']
+    
+    @pytest.mark.skipif(JOB_NUMBER_DTYPE is None, reason="pyarrow not installed")
+    def test_normalize_job_numbers_trims_arrow_strings(self):
+        """Test that job numbers already in the Arrow string dtype are still trimmed."""
+        job_numbers = pd.Series(['  JOB001  ', 'JOB002'], dtype=JOB_NUMBER_DTYPE)
+        
+        result = normalize_job_numbers(job_numbers)
+        
+        assert result.dtype == JOB_NUMBER_DTYPE
+        assert result.tolist() == ['JOB001', 'JOB002']
 
 
 class TestTrimJobNumbers:
@@ -130,10 +167,13 @@ class TestTrimJobNumbers:
         """Test basic job number trimming."""
         result_df = trim_job_numbers(sample_wip_data)
         
+        jobs = job_set(result_df)
         # Check that whitespace is trimmed
-        assert '  JOB001  ' not in result_df['Job Number'].values
-        assert 'JOB001' in result_df['Job Number'].values
-        assert all(job.strip() == job for job in result_df['Job Number'])
+        assert '  JOB001  ' not in jobs
+        assert 'JOB001' in jobs
+        # Same values as pandas' vectorized strip (the dtype is Arrow-backed when pyarrow is installed)
+        pd.testing.assert_series_equal(result_df['Job Number'], sample_wip_data['Job Number'].str.strip(),
+                                       check_dtype=False)
     
     def test_trim_job_numbers_preserves_other_columns(self, sample_wip_data):
         """Test that trimming preserves other columns."""
@@ -147,38 +187,35 @@ class TestTrimJobNumbers:
 class TestFilterClosedJobs:
     """Test cases for filter_closed_jobs function."""
     
-    def test_filter_closed_jobs_exclude_by_default(self, sample_wip_data):
-        """Test that closed jobs are excluded by default."""
-        result_df = filter_closed_jobs(sample_wip_data, include_closed=False)
-        
-        # Should exclude JOB002 and JOB004 (both closed)
-        assert len(result_df) == 2
-        assert '  JOB001  ' in result_df['Job Number'].values  # Note: whitespace preserved
-        assert 'JOB003' in result_df['Job Number'].values
-        assert 'JOB002' not in result_df['Job Number'].values
-        assert 'JOB004' not in result_df['Job Number'].values
+    @pytest.mark.parametrize("statuses, include_closed, expected_jobs", [
+        # Closed jobs are excluded by default (whitespace in job numbers is preserved)
+        (['Active', 'Closed', 'Active', 'CLOSED'], False, {'  JOB001  ', 'JOB003'}),
+        # All jobs are kept when closed jobs are requested
+        (['Active', 'Closed', 'Active', 'CLOSED'], True, {'  JOB001  ', 'JOB002', 'JOB003', 'JOB004'}),
+        # Status matching is case insensitive
+        (['Active', 'CLOSED', 'closed', 'Closed'], False, {'  JOB001  '}),
+        # Any casing of 'closed' is filtered out, and nothing else is
+        (['active', 'cLoSeD', 'ACTIVE', 'closed'], False, {'  JOB001  ', 'JOB003'}),
+    ], ids=['exclude_by_default', 'include_when_requested', 'case_insensitive', 'mixed_case'])
+    def test_filter_closed_jobs(self, sample_wip_data, statuses, include_closed, expected_jobs):
+        """Test which jobs are kept for each Status combination."""
+        data = sample_wip_data.assign(Status=statuses)
+        
+        result_df = filter_closed_jobs(data, include_closed=include_closed)
+        
+        assert len(result_df) == len(expected_jobs)
+        assert job_set(result_df) == expected_jobs
     
-    def test_filter_closed_jobs_include_when_requested(self, sample_wip_data):
-        """Test that closed jobs are included when requested."""
-        result_df = filter_closed_jobs(sample_wip_data, include_closed=True)
-        
-        # Should include all jobs
-        assert len(result_df) == len(sample_wip_data)
-        assert 'JOB002' in result_df['Job Number'].values
-        assert 'JOB004' in result_df['Job Number'].values
-    
-    def test_filter_closed_jobs_case_insensitive(self):
-        """Test that filtering is case insensitive."""
-        data = pd.DataFrame({
-            'Job Number': ['JOB001', 'JOB002', 'JOB003'],
-            'Status': ['Active', 'CLOSED', 'closed']
-        })
+    def test_filter_closed_jobs_is_vectorized(self, sample_wip_data, monkeypatch):
+        """Test that filtering doesn't fall back to a row-by-row Series.apply."""
+        def fail_apply(*args, **kwargs):
+            raise AssertionError("filter_closed_jobs should use the vectorized .str accessor")
+        monkeypatch.setattr(pd.Series, 'apply', fail_apply)
         
-        result_df = filter_closed_jobs(data, include_closed=False)
+        result_df = filter_closed_jobs(sample_wip_data, include_closed=False)
         
-        # Should exclude both CLOSED and closed
-        assert len(result_df) == 1
-        assert 'JOB001' in result_df['Job Number'].values
+        assert job_set(result_df) == {'  JOB001  ', 'JOB003'}
+        assert result_df['Status'].tolist() == ['active', 'active']
 
 
 class TestMergeWIPWithGL:
@@ -193,28 +230,21 @@ class TestMergeWIPWithGL:
         # Should have all WIP records (left join)
         assert len(result_df) == len(sample_wip_data)
         
-        # Check that GL data was merged correctly
-        job001_row = result_df[result_df['Job Number'] == 'JOB001'].iloc[0]
-        assert job001_row['Material'] == 9500.00
-        assert job001_row['Labor'] == 8200.00
-        assert job001_row['Other'] == 200.00
-        
-        # Check that missing GL data is filled with 0
-        job003_row = result_df[result_df['Job Number'] == 'JOB003'].iloc[0]
-        assert job003_row['Material'] == 0.00  # No GL data for JOB003
-        assert job003_row['Labor'] == 0.00
-        assert job003_row['Other'] == 0.00
+        # Check that GL data was merged correctly (rows in WIP order, JOB001-JOB004),
+        # and that missing GL data is filled with 0 (no GL data for JOB003 and JOB004)
+        assert_allclose(result_df['Material'].to_numpy(), [9500.00, 5200.00, 0.00, 0.00])
+        assert_allclose(result_df['Labor'].to_numpy(), [8200.00, 3800.00, 0.00, 0.00])
+        assert_allclose(result_df['Other'].to_numpy(), [200.00, 100.00, 0.00, 0.00])
     
     def test_merge_wip_with_gl_no_fill_zeros(self, sample_wip_data, sample_gl_data):
         """Test merging without filling missing values with zeros."""
         wip_trimmed = trim_job_numbers(sample_wip_data)
         result_df = merge_wip_with_gl(wip_trimmed, sample_gl_data, fill_missing_with_zero=False)
         
-        # Check that missing GL data is NaN
-        job003_row = result_df[result_df['Job Number'] == 'JOB003'].iloc[0]
-        assert pd.isna(job003_row['Material'])
-        assert pd.isna(job003_row['Labor'])
-        assert pd.isna(job003_row['Other'])
+        # Check that missing GL data is NaN (no GL data for JOB003 and JOB004)
+        assert_allclose(result_df['Material'].to_numpy(), [9500.00, 5200.00, np.nan, np.nan], equal_nan=True)
+        assert_allclose(result_df['Labor'].to_numpy(), [8200.00, 3800.00, np.nan, np.nan], equal_nan=True)
+        assert_allclose(result_df['Other'].to_numpy(), [200.00, 100.00, np.nan, np.nan], equal_nan=True)
     
     def test_merge_wip_with_gl_trimming(self):
         """Test that job numbers are trimmed during merge."""
@@ -233,8 +263,55 @@ class TestMergeWIPWithGL:
         result_df = merge_wip_with_gl(wip_data, gl_data)
         
         # Both jobs should have GL data despite whitespace differences
-        assert result_df.iloc[0]['Material'] == 1000.00
-        assert result_df.iloc[1]['Material'] == 2000.00
+        assert_allclose(result_df['Material'].to_numpy(), [1000.00, 2000.00])
+    
+    def test_merge_wip_with_gl_rejects_duplicate_gl_keys(self, sample_wip_data):
+        """Test that GL data with two rows for one job (after trimming) is rejected."""
+        gl_data = pd.DataFrame({
+            'Job Number': ['JOB001', '  JOB001  ', 'JOB002'],
+            'Material': [1000.00, 2000.00, 3000.00]
+        })
+        
+        with pytest.raises(pd.errors.MergeError, match="JOB001"):
+            merge_wip_with_gl(sample_wip_data, gl_data)
+    
+    @pytest.mark.parametrize("dtype", [
+        'string',
+        'category',
+        pytest.param('string[pyarrow]', marks=pytest.mark.skipif(JOB_NUMBER_DTYPE is None,
+                                                                 reason="pyarrow not installed")),
+    ])
+    def test_merge_wip_with_gl_job_number_dtypes(self, sample_wip_data, sample_gl_data, dtype):
+        """Test that the merge gives the same result whatever the Job Number dtype."""
+        expected_df = merge_wip_with_gl(sample_wip_data.astype({'Job Number': object}),
+                                        sample_gl_data.astype({'Job Number': object}))
+        
+        result_df = merge_wip_with_gl(sample_wip_data.astype({'Job Number': dtype}),
+                                      sample_gl_data.astype({'Job Number': dtype}))
+        
+        pd.testing.assert_frame_equal(result_df, expected_df)
+        # The padded '  JOB001  ' is trimmed whatever the dtype, so it gets its GL amounts
+        assert result_df.loc[result_df['Job Number'] == 'JOB001', 'Material'].tolist() == [9500.00]
+    
+    def test_merge_matches_map_implementation(self, sample_wip_data, sample_gl_data):
+        """Test that the merge gives the same Material as a Series.map lookup."""
+        gl_material = sample_gl_data.set_index(sample_gl_data['Job Number'].str.strip())['Material']
+        expected_material = sample_wip_data['Job Number'].str.strip().map(gl_material).fillna(0)
+        
+        result_df = merge_wip_with_gl(sample_wip_data, sample_gl_data)
+        
+        assert np.array_equal(result_df['Material'].to_numpy(), expected_material.to_numpy())
+    
+    def test_merge_wip_with_gl_scales(self, scale_data):
+        """Test the merge on a small and a large number of jobs (timed in test_benchmarks.py)."""
+        wip_data, gl_data = scale_data
+        
+        result_df = merge_wip_with_gl(wip_data, gl_data)
+        
+        # Every WIP job is kept, jobs with GL data get it and the rest get 0
+        assert len(result_df) == len(wip_data)
+        assert_allclose(result_df['Material'].to_numpy()[::2], gl_data['Material'].to_numpy())
+        assert (result_df['Material'].to_numpy()[1::2] == 0).all()
 
 
 class TestComputeVariances:
@@ -252,17 +329,14 @@ class TestComputeVariances:
         
         result_df = compute_variances(data)
         
-        # Check Material variance (Actual - Budget)
-        assert result_df.iloc[0]['Material Variance'] == -500.00  # 9500 - 10000
-        assert result_df.iloc[1]['Material Variance'] == 200.00   # 5200 - 5000
+        # Check Material variance (Actual - Budget): 9500 - 10000, 5200 - 5000
+        assert_allclose(result_df['Material Variance'].to_numpy(), [-500.00, 200.00])
         
-        # Check Labor variance (Actual - Budget)
-        assert result_df.iloc[0]['Labor Variance'] == 200.00      # 8200 - 8000
-        assert result_df.iloc[1]['Labor Variance'] == -200.00     # 3800 - 4000
+        # Check Labor variance (Actual - Budget): 8200 - 8000, 3800 - 4000
+        assert_allclose(result_df['Labor Variance'].to_numpy(), [200.00, -200.00])
         
-        # Check Total variance
-        assert result_df.iloc[0]['Total Variance'] == -300.00     # -500 + 200
-        assert result_df.iloc[1]['Total Variance'] == 0.00        # 200 + (-200)
+        # Check Total variance: -500 + 200, 200 + (-200)
+        assert_allclose(result_df['Total Variance'].to_numpy(), [-300.00, 0.00])
     
     def test_compute_variances_missing_budget_columns(self):
         """Test variance computation when budget columns are missing."""
@@ -290,49 +364,38 @@ class TestComputeVariances:
         
         result_df = compute_variances(data)
         
-        # NaN budget should be treated as 0
-        assert result_df.iloc[0]['Material Variance'] == -500.00  # 9500 - 10000
-        assert result_df.iloc[1]['Material Variance'] == 5200.00  # 5200 - 0
-
-
-class TestGetJobsForUpdate:
-    """Test cases for get_jobs_for_update function."""
+        # NaN budget should be treated as 0: 9500 - 10000, 5200 - 0
+        assert_allclose(result_df['Material Variance'].to_numpy(), [-500.00, 5200.00])
     
-    def test_get_jobs_for_update_material_section(self):
-        """Test getting jobs for Material section (5040)."""
+    def test_compute_variances_dtype_preserved(self):
+        """Test that float32 amounts and budgets give float32 variances (no upcast to float64)."""
         data = pd.DataFrame({
             'Job Number': ['JOB001', 'JOB002'],
-            'Job Name': ['Alpha', 'Beta'],
-            'Material': [9500.00, 5200.00],
-            'Labor': [8200.00, 3800.00],
-            'Budget Material': [10000.00, 5000.00],
-            'Material Variance': [-500.00, 200.00]
+            'Material': np.array([9500.00, 5200.00], dtype=np.float32),
+            'Sub Labor': np.array([8200.00, 3800.00], dtype=np.float32),
+            'Budget Material': np.array([10000.00, np.nan], dtype=np.float32),
+            'Budget Labor': np.array([8000.00, 4000.00], dtype=np.float32)
         })
         
-        result_df = get_jobs_for_update(data, '5040')
+        result_df = compute_variances(data)
         
-        # Should include Material-related columns
-        expected_columns = ['Job Number', 'Job Name', 'Material', 'Budget Material', 'Material Variance']
-        assert all(col in result_df.columns for col in expected_columns)
-        assert 'Labor' not in result_df.columns
+        for col in ['Material Variance', 'Sub Labor Variance', 'Total Variance']:
+            assert result_df[col].dtype == np.float32
+        assert_allclose(result_df['Material Variance'].to_numpy(), [-500.00, 5200.00])
+
+
+class TestGetJobsForUpdate:
+    """Test cases for get_jobs_for_update function."""
     
-    def test_get_jobs_for_update_labor_section(self):
-        """Test getting jobs for Labor section (5030)."""
-        data = pd.DataFrame({
-            'Job Number': ['JOB001', 'JOB002'],
-            'Job Name': ['Alpha', 'Beta'],
-            'Material': [9500.00, 5200.00],
-            'Labor': [8200.00, 3800.00],
-            'Budget Labor': [8000.00, 4000.00],
-            'Labor Variance': [200.00, -200.00]
-        })
-        
-        result_df = get_jobs_for_update(data, '5030')
-        
-        # Should include Labor-related columns
-        expected_columns = ['Job Number', 'Job Name', 'Labor', 'Budget Labor', 'Labor Variance']
-        assert all(col in result_df.columns for col in expected_columns)
-        assert 'Material' not in result_df.columns
+    @pytest.mark.parametrize("section, expected_columns", [
+        ('5040', ['Job Number', 'Job Name', 'Material', 'Budget Material', 'Material Variance']),
+        ('5030', ['Job Number', 'Job Name', 'Labor', 'Budget Labor', 'Labor Variance']),
+    ], ids=['material_section', 'labor_section'])
+    def test_get_jobs_for_update_section(self, section_data, section, expected_columns):
+        """Test that each section gets exactly its own columns and values."""
+        result_df = get_jobs_for_update(section_data, section)
+        
+        pd.testing.assert_frame_equal(result_df, section_data[expected_columns], check_like=True)
     
     def test_get_jobs_for_update_invalid_section(self):
         """Test error handling for invalid section type."""
@@ -345,6 +408,7 @@ class TestGetJobsForUpdate:
 class TestProcessWIPMerge:
     """Test cases for the complete process_wip_merge pipeline."""
     
+    @pytest.mark.slow
     def test_process_wip_merge_complete_pipeline(self, sample_wip_excel_file, sample_gl_data):
         """Test the complete WIP merge processing pipeline."""
         result_df = process_wip_merge(sample_wip_excel_file, sample_gl_data, include_closed=False)
@@ -355,10 +419,11 @@ class TestProcessWIPMerge:
         assert 'Material' in result_df.columns
         assert 'Labor' in result_df.columns
         
+        jobs = job_set(result_df)
         # Should exclude closed jobs by default
-        assert 'JOB002' not in result_df['Job Number'].values  # JOB002 is closed
-        assert 'JOB001' in result_df['Job Number'].values      # JOB001 is active
-        assert 'JOB003' in result_df['Job Number'].values      # JOB003 is active
+        assert 'JOB002' not in jobs  # JOB002 is closed
+        assert 'JOB001' in jobs      # JOB001 is active
+        assert 'JOB003' in jobs      # JOB003 is active
     
     def test_process_wip_merge_include_closed(self, sample_wip_excel_file, sample_gl_data):
         """Test pipeline with closed jobs included."""
@@ -366,7 +431,20 @@ class TestProcessWIPMerge:
         
         # Should include all jobs including closed ones
         assert len(result_df) == 3  # All jobs from sample file
-        assert 'JOB002' in result_df['Job Number'].values  # Closed job included
+        jobs = job_set(result_df)
+        assert 'JOB002' in jobs  # Closed job included
+        assert result_df.loc[result_df['Job Number'] == 'JOB002', 'Status'].tolist() == ['Closed']
+    
+    @pytest.mark.slow
+    def test_process_wip_merge_from_dataframe(self, sample_wip_excel_file, sample_gl_data):
+        """Test that loaded WIP data gives the same result as the file path."""
+        wip_df = pd.read_excel(sample_wip_excel_file)
+        
+        result_df = process_wip_merge(wip_file=wip_df, gl_df=sample_gl_data, include_closed=False)
+        expected_df = process_wip_merge(sample_wip_excel_file, sample_gl_data, include_closed=False)
+        
+        pd.testing.assert_frame_equal(result_df, expected_df)
+        assert wip_df['Status'].tolist() == ['Active', 'Closed', 'Active']  # Input unchanged
 
 
 if __name__ == "__main__":